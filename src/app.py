@@ -411,7 +411,7 @@ def upload_file():
         # Extract from PDF if not cached or force refresh
         if extracted_data is None:
             try:
-                extractor = PDFExtractor(filepath)
+                extractor = PDFExtractor(filepath, force_refresh=force_refresh)
                 extracted_data = extractor.extract_all()
                 
                 # Resolve relative rules
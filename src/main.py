@@ -342,7 +342,7 @@ def main():
     # Extract from PDF if not cached
     if extracted_data is None:
         print(f"Extracting data from PDF: {pdf_path}")
-        extractor = PDFExtractor(pdf_path)
+        extractor = PDFExtractor(pdf_path, parallel_pages=True, pdf_hash=pdf_hash)
         extracted_data = extractor.extract_all()
         
         # Prompt for term if missing
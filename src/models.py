@@ -49,6 +49,19 @@ class SectionOption:
     end_time: time              # When the section ends (e.g., 11:30 AM)
     location: Optional[str] = None  # Room/building where it meets (e.g., "UC 202"), or None if unknown
     date_range: Optional[Tuple[date, date]] = None  # Custom date range if different from term dates
+    
+    @property
+    def days_mask(self) -> int:
+        """Meeting days as a bitmask: bit n is set if the section meets on weekday n.
+        
+        For example, Monday/Wednesday/Friday ([0, 2, 4]) is 0b10101. It is computed
+        from days_of_week, so the two can't disagree, and lets callers test a day
+        with one bit operation (days_mask >> weekday & 1) instead of a list scan.
+        """
+        mask = 0
+        for day in self.days_of_week:
+            mask |= 1 << day
+        return mask
 
 
 @dataclass
@@ -9,7 +9,12 @@ Version 2.0: Now uses document structure layer for improved extraction.
 
 import os
 import re
+import threading
 import pdfplumber
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
 from datetime import date, datetime, time
 from typing import List, Optional, Tuple, Dict, Any
@@ -18,6 +23,23 @@ import dateparser
 from .models import (
     CourseTerm, SectionOption, AssessmentTask, ExtractedCourseData
 )
+from .cache import compute_pdf_hash
+
+# RE2 (google-re2) gives linear-time matching for the alternation-heavy patterns below.
+# Optional - falls back to the standard library re module.
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# pyahocorasick matches a whole keyword list in one pass over a line (Aho-Corasick automaton).
+# Optional - falls back to a compiled keyword alternation.
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 # Try to import new extraction modules
 try:
@@ -31,22 +53,822 @@ except ImportError:
 # Constants
 MAX_FILE_SIZE_MB = 5.0  # Increased from 2.0MB to 5.0MB
 MAX_PAGES_TO_SEARCH = 8
+PAGE_CACHE_SIZE = 16  # Number of PDFs whose page text and tables are kept in memory
+PARALLEL_PAGE_THRESHOLD = 6  # Below this many unread pages, process startup costs more than it saves
+HIGH_CONFIDENCE_ASSESSMENT_SCORE = 75  # New-pipeline score at or above which legacy assessments are skipped
+
+# Page text and tables of recently opened PDFs, keyed by compute_pdf_hash of the file:
+# hash -> (page count, {page index: text}, {page index: tables}, tables lock). Extractors
+# for the same PDF share these dicts, so re-extracting an upload skips the PDF parse and
+# table detection for pages already read. They also share the lock guarding the tables
+# dict, since extractors for the same upload may run in different request threads.
+_PAGE_CACHE: Dict[str, Tuple[
+    int, Dict[int, Optional[str]], Dict[int, List[List[List[Optional[str]]]]], threading.Lock
+]] = {}
+# Guards inserts into and evictions from _PAGE_CACHE, which extractors in different
+# request threads may do at the same time
+_PAGE_CACHE_LOCK = threading.Lock()
+
+# Month names/abbreviations accepted in syllabus dates
+_MONTH_NUMBERS = {
+    'jan': 1, 'january': 1,
+    'feb': 2, 'february': 2,
+    'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4,
+    'may': 5,
+    'jun': 6, 'june': 6,
+    'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8,
+    'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12,
+}
+
+# Academic year for each month: Jan-Apr fall in the winter term of the following year
+_MONTH_TO_YEAR = {name: (2026 if num <= 4 else 2025) for name, num in _MONTH_NUMBERS.items()}
+
+# Assessment table row detection patterns.
+# These are matched against the lowercased line, so they don't need re.IGNORECASE.
+# "Midterm Test N" anywhere in the line takes priority; otherwise a bare "Midterm Test"
+_MIDTERM_TEST_RE = re.compile(r'^(?:.*?midterm\s+test\s+(\d+)|.*?midterm\s+test(?:\s|\(|,|$))')
+_PEERWISE_NEXT_ASSESSMENT_RE = re.compile(r'^(?:midterm|final|assignment\s+\d+|peerwise|optional|designated)')
+_PEERWISE_AUTHOR_SEEN_RE = re.compile(r'author.*?(\w+\.?\s+\w+\.?\s+\d+)')
+_PEERWISE_FEEDBACK_SEEN_RE = re.compile(r'feedback.*?(\w+\.?\s+\w+\.?\s+\d+)')
+_ASSIGNMENT_NUM_RE = re.compile(r'assignment\s+(\d+)')
+
+# PeerWise due dates: "Author: Mon, Oct. 27th by 11:59 PM" and "feedback: Wed, Oct. 29th by 11:59 PM"
+_PEERWISE_DATE_RE = re.compile(
+    r'(?P<kind>Author|feedback):?\s*(?:Mon|Monday|Tue|Tuesday|Wed|Wednesday|Thu|Thursday|Fri|Friday|Sat|Saturday|Sun|Sunday),?\s+'
+    r'(?P<month>Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)\.?\s+'
+    r'(?P<day>\d{1,2})(?:st|nd|rd|th)?',
+    re.IGNORECASE
+)
+_ASSIGNMENT_START_RE = re.compile(r'^assignment\s+(\d+)')
+
+# Assessment type classification rules, checked in priority order (first match wins)
+_ASSESSMENT_TYPE_RULES = (
+    ('assignment', 'assignment'),
+    ('hw', 'assignment'),
+    ('homework', 'assignment'),
+    ('lab report', 'lab_report'),
+    ('laboratory report', 'lab_report'),
+    ('quiz', 'quiz'),
+    ('midterm', 'midterm'),
+    ('mid-term', 'midterm'),
+    ('final', 'final'),
+    ('project', 'project'),
+)
+
+# Due times in assessment rows, matched against the lowercased row text.
+# PeerWise rows: "by 11:59 PM", flagging the one that follows "feedback:"
+_PEERWISE_TIME_RE = re.compile(
+    r'(?:(?P<feedback>feedback):?[^.]*?)?by\s+(?P<hour>\d{1,2})(?:[:–-](?P<minute>\d{2}))?\s*(?P<ampm>am|pm)'
+)
+# Other rows: "11:59 PM", or a range like "6-8 PM" / "10:00-11:30 AM"
+_TIME_RANGE_RE = re.compile(
+    r'(?P<hour>\d{1,2})(?:[:–-](?P<minute>\d{2}))?\s*'
+    r'(?:[-–]\s*(?P<end_hour>\d{1,2})(?:[:–-](?P<end_minute>\d{2}))?)?\s*(?P<ampm>am|pm)'
+)
+
+# Assessment type for each fixed-name row kind in the assessment table parser
+# (rows matched by the general pattern are classified from their name)
+_ROW_KIND_TYPES = {
+    'midterm': 'midterm',
+    'peerwise': 'assignment',
+    'assignment': 'assignment',
+    'final': 'final',
+    'bonus': 'assignment',
+}
+
+# Keywords that every assessment row (or the Designated Assessment stop line) contains.
+# Lines without any of these can't start a row, so the table parser skips them without
+# running the per-branch patterns.
+_ASSESSMENT_CANDIDATE_RE = re.compile(
+    r'midterm|mid-term|peerwise|assignment|exam|bonus|quiz|report|redesign|participation'
+    r'|project|presentation|paper|essay|reflection|designated'
+)
+
+
+# RE2's \s, \d and \w are ASCII-only, while re matches Unicode in str patterns
+# (e.g. the non-breaking spaces pdfplumber often returns). Members of the matching
+# Unicode classes, written in RE2 syntax.
+_RE2_UNICODE_CLASSES = {
+    's': r'\s\x{0b}\x{1c}-\x{1f}\x{85}\p{Z}',
+    'd': r'\p{Nd}',
+    'w': r'\p{L}\p{N}_',
+}
+
+
+def _re2_unicode_classes(pattern: str) -> str:
+    """Rewrite \\s, \\d and \\w in a str pattern so RE2 matches what re would."""
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            members = _RE2_UNICODE_CLASSES.get(pattern[i + 1])
+            if members is None:
+                parts.append(pattern[i:i + 2])
+            else:
+                parts.append(members if in_class else f'[{members}]')
+            i += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        parts.append(char)
+        i += 1
+    return ''.join(parts)
+
+
+def _compile_alternation(pattern: str):
+    """Compile an alternation-heavy pattern with RE2 when available, else with re.
+    
+    Patterns must stick to the syntax both engines share (no lookarounds or
+    backreferences). Case-insensitive patterns should use the inline (?i) flag.
+    Patterns are rewritten for RE2 so they keep re's Unicode \\s, \\d and \\w.
+    
+    Only for scans over whole pages or documents (term names, schedule families,
+    legacy page scans). RE2's per-call overhead makes it several times slower than
+    re on short inputs, so patterns run once per line use re.compile directly.
+    """
+    if HAS_RE2:
+        return re2.compile(_re2_unicode_classes(pattern))
+    return re.compile(pattern)
+
+
+def _build_keyword_matcher(keywords):
+    """Build a function that tells whether a lowercased string contains any of the keywords.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, else one
+    compiled regex alternation. Either way the string is scanned once, instead
+    of once per keyword.
+    """
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    keyword_re = re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    return lambda text: keyword_re.search(text) is not None
+
+
+# Assessment keywords for plain-text grade breakdown lines (matched against the lowercased line)
+_TEXT_ASSESSMENT_KEYWORDS = (
+    'quiz', 'midterm', 'final', 'exam', 'test', 'assignment', 'project',
+    'lab', 'report', 'essay', 'presentation', 'participation', 'homework',
+    'peerwise', 'pcb', 'bonus'
+)
+_has_text_assessment_keyword = _build_keyword_matcher(_TEXT_ASSESSMENT_KEYWORDS)
+
+# Lines that start a new assessment row or section (stop collecting continuation lines).
+# Matched against the lowercased line.
+_ASSESSMENT_ROW_STOP_RE = re.compile(
+    r'^(?:'
+    r'(?:in\s+class\s+)?quiz\s+\d+'  # Quiz 1, Quiz 2, etc.
+    r'|midterm\s+test'  # Midterm Test 1, Midterm Test 2, or just Midterm Test
+    r'|(?:final\s+)?exam'  # Final Exam
+    r'|peerwise'  # New PeerWise assignment
+    r'|assignment\s+\d+\s+(?:slide|augment)'  # Assignment X Slide redesign (new assessment)
+    r'|(?:optional\s+)?bonus'  # Optional Bonus
+    r'|designated|information|general'  # Section headers
+    r')'
+)
+
+# Fallback assessment name pattern for table rows; the match becomes the assessment title
+_GENERAL_ASSESSMENT_RE = re.compile(
+    r'(?i)((?:In\s+Class\s+)?(?:Quiz|QUIZ)\s+\d+|(?:Midterm|MIDTERM|Mid-term)\s+(?:Test|Exam)?\s*\d*|(?:Final\s+)?(?:Exam|EXAM|Examination)|(?:Assignment|ASSIGNMENT)\s+\d+|(?:PeerWise|Peerwise)\s+(?:Assignment|ASSIGNMENT)\s+\d+|(?:Lab\s+)?(?:Report|REPORT)|(?:Slide\s+)?(?:redesign|Redesign)(?:\s+&\s+Teach)?|(?:Participation|Participation\s+Grade)|(?:Project|PROJECT)|(?:Presentation|PRESENTATION)|(?:Paper|PAPER)|(?:Essay|ESSAY)|(?:Reflection|REFLECTION)|(?:Optional\s+)?(?:Bonus|BONUS)\s+(?:Assignment|ASSIGNMENT)?)'
+)
+
+
+# Day abbreviations used in schedules ("MWF", "TTh", "TR", "Mon/Wed/Fri") as weekday bits
+# (bit 0 = Monday). Python uses 0=Monday, 1=Tuesday, etc. Day names are keyed by their first
+# three letters, see _DAY_TOKEN_RE.
+_DAY_ABBREVIATION_BITS = {
+    'M': 1 << 0, 'MON': 1 << 0,
+    'T': 1 << 1, 'TUE': 1 << 1,
+    'W': 1 << 2, 'WED': 1 << 2,
+    'TH': 1 << 3, 'R': 1 << 3, 'THU': 1 << 3,
+    'F': 1 << 4, 'FR': 1 << 4, 'FRI': 1 << 4,
+    'S': 1 << 5, 'SAT': 1 << 5,
+    'SU': 1 << 6, 'SUN': 1 << 6,
+}
+# Day tokens in an uppercased day string, longest first: whole day names ("TUESDAY",
+# "THURS", "SAT") before two-letter and single-letter abbreviations, so letters inside
+# a day name aren't read as days of their own (the U-E-S of "TUES" isn't a Saturday)
+_DAY_TOKEN_RE = re.compile(
+    r'(?:MON|TUES|WEDNES|THURS|FRI|SATUR|SUN)DAYS?'
+    r'|MON|TUES?|WED|THU(?:RS?)?|FRI|SAT|SUN'
+    r'|TH|SU|FR|[MTWRFS]'
+)
+# Sorted weekday numbers for every 7-bit day mask, e.g. _DAY_MASK_DAYS[0b10101] == (0, 2, 4)
+_DAY_MASK_DAYS = tuple(
+    tuple(day for day in range(7) if mask & (1 << day)) for mask in range(1 << 7)
+)
+
+# Patterns used by the term, schedule, assessment and course info extractors.
+# Compiled once at import instead of on every call.
+_TERM_NAME_PATTERNS = [
+    _compile_alternation(r'(?i)(Fall|Winter|Summer)\s+(\d{4})'),  # "Fall 2026"
+    _compile_alternation(r'(?i)(Fall|Winter|Summer)\s+Term\s+(\d{4})'),  # "Fall Term 2026"
+    _compile_alternation(r'(?i)(Fall|Winter|Summer)\s+Semester\s+(\d{4})'),  # "Fall Semester 2026"
+]
+# Default term dates by season: ((start month, day), (end month, day))
+_SEASON_RANGES = {
+    'Fall': ((9, 1), (12, 15)),  # September 1 - December 15
+    'Winter': ((1, 8), (4, 30)),  # January 8 - April 30
+    'Summer': ((5, 1), (8, 31)),  # May 1 - August 31
+}
+
+# Legacy schedule patterns (last-resort fallback), each family scanned as one alternation.
+# Alternatives with six groups start with the section number. Every alternative needs a
+# section keyword, and the day letters must start a word: a bare "days time" pattern
+# read letters inside ordinary words ("wiTH 10:30", "PosTS 2:00") as meeting days.
+_LECTURE_SCHEDULE_PATTERNS = [
+    ('lecture_days', r'Lecture\s+([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})\s*(?:AM|PM)?'),
+    ('section', r'(?:Lecture|LEC|Class|Section)\s*(\d{3})?\s*[:\s]+([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})'),
+    ('lecture_short', r'(?:Lecture|LEC)\s*\b([MTWThFS]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})'),
+]
+_LAB_SCHEDULE_PATTERNS = [
+    ('section', r'(?:Lab|LAB|Laboratory|Tutorial|TUT)\s*(\d{3})?\s*[:\s]+([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})'),
+    ('lab_short', r'(?:Lab|LAB|Laboratory|Tutorial|TUT)\s*\b([MTWThFS]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})'),
+]
+
+
+def _named_alternation(patterns, ignore_case: bool = False):
+    """Compile (name, pattern) pairs into one alternation of named groups.
+    
+    Compiled with _compile_alternation, so RE2 is used when available.
+    
+    Returns:
+        Tuple of (compiled regex, {name: (first, end)}) where match.groups()[first:end]
+        are the groups of the alternative named by match.lastgroup
+    """
+    combined = _compile_alternation(
+        ('(?i)' if ignore_case else '') + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in patterns)
+    )
+    slices = {
+        name: (combined.groupindex[name], combined.groupindex[name] + re.compile(pattern).groups)
+        for name, pattern in patterns
+    }
+    return combined, slices
+
+
+# Each family as (compiled alternation, group slices, literals): every pattern of the
+# family needs one of the (lowercase) literals, so text without any is skipped unscanned
+_LEGACY_SCHEDULE_FAMILIES = {
+    'lecture': (*_named_alternation(_LECTURE_SCHEDULE_PATTERNS, ignore_case=True), ('lec', 'class', 'section')),
+    'lab': (*_named_alternation(_LAB_SCHEDULE_PATTERNS, ignore_case=True), ('lab', 'tut')),
+}
+
+# Day/time patterns shared by lecture and lab text extraction, each with literals
+# (lowercase) that any match must contain, so patterns can be skipped without a scan
+_SCHEDULE_TEXT_PATTERNS = [
+    # "Mondays, 1:30 – 4:30 pm in SSC 3018" (every weekday name ends in "day")
+    (('day',), _compile_alternation(r'(?i)(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)s?[,\s]+(\d{1,2})[:.:](\d{2})\s*[-–]\s*(\d{1,2})[:.:](\d{2})\s*([ap]\.?m\.?)?(?:\s+in\s+([A-Z0-9\s]+))?')),
+    # "Lecture: Friday 1.30 pm-2.30 pm"
+    (('lecture', 'lab', 'tutorial'), _compile_alternation(r'(?i)(?:Lecture|Lab|Tutorial)[:\s]+([A-Za-z]+(?:day)?)\s+(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?')),
+    # "Section 001: Tuesday, 1:30pm-4:30pm"
+    (('section',), _compile_alternation(r'(?i)Section\s*\d*[:\s]+([A-Za-z]+(?:day)?)[,\s]+(\d{1,2})[:.:](\d{2})\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2})[:.:](\d{2})\s*([ap]\.?m\.?)?')),
+]
+# Keyword-led time patterns (with required literals, as above) and table row keywords, per section type
+_SCHEDULE_KEYWORD_PATTERNS = {
+    'lecture': (('lec', 'class'), _compile_alternation(r'(?i)(?:lecture|lec|class)[\s:]+.*?(\d{1,2})[:.:](\d{2})\s*[-–]\s*(\d{1,2})[:.:](\d{2})')),
+    'lab': (('lab', 'tutorial'), _compile_alternation(r'(?i)(?:lab|laboratory|tutorial)[\s:]+.*?(\d{1,2})[:.:](\d{2})\s*[-–]\s*(\d{1,2})[:.:](\d{2})')),
+}
+_has_schedule_table_keyword = {
+    'lecture': _build_keyword_matcher(("lecture", "lec", "class")),
+    'lab': _build_keyword_matcher(("lab", "laboratory", "tutorial", "tut")),
+}
+
+# Legacy assessment patterns (assessments with due dates)
+_LEGACY_ASSESSMENT_PATTERNS = [
+    ('assignment', r'(Assignment|ASSIGNMENT|HW|Homework)\s+(\d+)[^\n]*(?:due|Due|DUE)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})'),
+    ('quiz', r'(Quiz|QUIZ|Test)\s+(\d+)[^\n]*(?:due|Due|DUE|on|On)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})'),
+    ('lab_report', r'(Lab\s+Report|Laboratory\s+Report|Lab\s+Assignment)\s+(\d+)[^\n]*(?:due|Due|DUE)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})'),
+    ('final', r'(Final\s+Exam|FINAL|Final\s+Examination)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})'),
+    ('midterm', r'(Midterm|MIDTERM|Mid-term)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})'),
+]
+# Type of a legacy match: first case-sensitive needle found in the matched text wins.
+# Quiz titles carry their number; midterm/final get fixed titles; others use the matched text.
+_LEGACY_TYPE_RULES = (
+    ('Quiz', 'quiz'),
+    ('Midterm', 'midterm'),
+    ('Final', 'final'),
+    ('Assignment', 'assignment'),
+    ('HW', 'assignment'),
+)
+_LEGACY_TYPE_TITLES = {
+    'midterm': "Midterm Exam",
+    'final': "Final Exam",
+}
+# Compiled separately rather than as one alternation: matches of one alternation can't
+# overlap, so a quiz running up to its due date would hide a final exam (and its date)
+# named inside that span, e.g. "Quiz 3 due before the Final Exam on Dec 12, 2025".
+# Each is still compiled with RE2 when available.
+_LEGACY_ASSESSMENT_RES = [
+    (kind, _compile_alternation('(?i)' + pattern)) for kind, pattern in _LEGACY_ASSESSMENT_PATTERNS
+]
+# Lowercase substrings at least one of which every legacy match contains
+_has_legacy_assessment_keyword = _build_keyword_matcher(
+    ('assignment', 'hw', 'homework', 'quiz', 'test', 'lab', 'final', 'mid')
+)
+# Month abbreviations that mark a legacy match group as (part of) a due date, as one
+# case-sensitive alternation (one search per group instead of twelve substring checks)
+_LEGACY_DATE_MONTH_RE = re.compile('Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep')
+_MONTH_NAME_RE = re.compile(r'(Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)', re.IGNORECASE)
+
+# Relative deadline rules, e.g. "due 24 hours after the lab"
+# Groups: amount, unit (hour/day/week), anchor (lab/tutorial/lecture)
+_RELATIVE_RULE_RE = _compile_alternation(
+    r'(?i)due\s+(\d+)\s+(hour|day|week)s?\s+after\s+(?:the\s+)?(lab|tutorial|lecture)'
+)
+
+# Title words that mark a well-named assessment when scoring extraction quality
+_has_common_assessment_type = _build_keyword_matcher(
+    ('exam', 'midterm', 'final', 'quiz', 'assignment', 'lab', 'test')
+)
+
+# Assessment titles to drop (matched against the lowercased title): titles starting
+# with "#" (including "#Completion"), and just "Completion" or "Completion#"
+_EXCLUDED_TITLE_RE = re.compile(r'#|completion#?$')
+# Title normalization for deduplication
+_IN_CLASS_PREFIX_RE = re.compile(r'^in\s+class\s+')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+_TITLE_CORE_NUMBER_RE = re.compile(r'^(quiz|midterm|final|assignment|lab\s+report).*?(\d+)')
+_TITLE_CORE_TYPE_RE = re.compile(r'^(quiz|midterm|final|assignment|lab\s+report).*')
+
+# Course code and name detection on the first page
+_COURSE_CODE_RE = re.compile(r'([A-Z]{2,4})\s+(\d{3,4}[A-Z]?)')
+# Lines that are obviously not course names, as one alternation (one search per line)
+_COURSE_NAME_SKIP_RE = re.compile(
+    '|'.join(['university', 'www.', 'http', '@', 'email', 'phone', 'office',
+              'instructor', 'department of', 'course outline', 'syllabus', 'winter',
+              'fall', 'spring', 'summer', 'semester', r'20\d{2}']),
+    re.IGNORECASE
+)
+_COURSE_NAME_RE = re.compile(r'^[A-Za-z\s&\-]+$')
+
+# Day names/abbreviations in schedule text, tried in order: (pattern, fixed days or None to parse)
+_SCHEDULE_DAY_PATTERNS = [
+    (re.compile(r'\b(Monday)s?\b', re.IGNORECASE), [0]),
+    (re.compile(r'\b(Tuesday)s?\b', re.IGNORECASE), [1]),
+    (re.compile(r'\b(Wednesday)s?\b', re.IGNORECASE), [2]),
+    (re.compile(r'\b(Thursday)s?\b', re.IGNORECASE), [3]),
+    (re.compile(r'\b(Friday)s?\b', re.IGNORECASE), [4]),
+    (re.compile(r'\b(Saturday)s?\b', re.IGNORECASE), [5]),
+    (re.compile(r'\b(Sunday)s?\b', re.IGNORECASE), [6]),
+    # MWF, TR, etc. Slash-separated lists ("M/W/F") are left to the legacy schedule
+    # patterns, which read them whole (one letter of the list would pass for all the days)
+    (re.compile(r'(?<!/)\b([MTWRF]{1,5})\b(?!/)', re.IGNORECASE), None),
+]
+_SCHEDULE_TIME_RE = re.compile(r'(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?', re.IGNORECASE)
+
+# Plain-text grade breakdowns ("Midterm Test 35%")
+_EVALUATION_HEADING_RE = re.compile(r'(?:Methods\s+of\s+)?Evaluation\b', re.IGNORECASE)
+# Section headings after the plain "Evaluation" one, tried in order, each with a word it can't match without
+# ("Evaluation" itself is found with str.find, see _find_text_evaluation_section)
+_TEXT_EVALUATION_SECTION_PATTERNS = [
+    (('evaluation',), re.compile(r'Assessment\s+(?:and\s+)?Evaluation', re.IGNORECASE)),
+    (('scheme',), re.compile(r'Grading\s+Scheme', re.IGNORECASE)),
+    (('breakdown',), re.compile(r'Grade\s+Breakdown', re.IGNORECASE)),
+    (('breakdown',), re.compile(r'Mark\s+Breakdown', re.IGNORECASE)),
+    (('evaluation',), re.compile(r'Course\s+Evaluation', re.IGNORECASE)),
+]
+_PERCENT_WEIGHT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_TRAILING_NUMBER_WEIGHT_RE = re.compile(r'\s(\d{1,2}(?:\.\d+)?)\s*$')
+_LEADING_BULLET_RE = re.compile(r'^[\s\-•·]+')
+_TRAILING_PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)$')  # With the space before it, so no strip is needed
+_TRAILING_NUMBER_RE = re.compile(r'\s+\d+$')
+# Policy/requirement text that looks like a weighted line but isn't an assessment (use .match)
+_POLICY_TEXT_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'^to be eligible',
+    r'^to obtain',
+    r'^at least (a|an|\d)',
+    r'^you must',
+    r'^students must',
+    r'^a (minimum|final|passing|grade)',
+    r'^the (minimum|final|passing)',
+    r'^will be reweighted',
+    r'^there (is|are|will)',
+    r'^each is worth',
+    r'result in',
+    r'weighted average',
+    r'^obtain a',
+    r'^achieve',
+    r'a mark of',
+    r'a grade of',
+)))
+# Verbs (space-delimited, in the lowercased name) that mark a sentence rather than an assessment title
+_SENTENCE_VERB_RE = re.compile(' (?:is|are|will be|must|should|may|can) ')
+
+# Assessment section and table header in the text-based table parser
+# The "Policy" and 1000-line variants this replaced only ever matched where this one already had
+_ASSESSMENT_SECTION_RE = re.compile(r'(?:8\.\s*)?Assessment\s+(?:and\s+)?Evaluation[^\n]*(?:\n[^\n]*){0,500}', re.IGNORECASE | re.DOTALL)
+_NEXT_SECTION_RE = re.compile(r'\n(?:\d+\.\s+)?(?:Course|Instructor|Textbook|Schedule|Policies|Grading|Contact|Information|General|Appendix)', re.IGNORECASE)
+_ASSESSMENT_MENTION_RE = re.compile(r'Assessment[^\n]*(?:\n[^\n]*){0,200}', re.IGNORECASE)
+# Full "Assessment Format Weight Due Date Flexibility" header, or the shorter "Assessment Format Weight"
+_ASSESSMENT_TABLE_HEADER_RE = re.compile(
+    r'(?P<full>Assessment\s+(?:Format\s+)?(?:Weight|Weighting)\s+(?:Due\s+)?Date\s*(?:Flexibility)?)'
+    r'|Assessment\s+Format\s+Weight',
+    re.IGNORECASE
+)
+
+# Table cells and titles
+_HAS_PERCENT_RE = re.compile(r'\d+\.?\d*%')
+_PERCENT_VALUE_RE = re.compile(r'(\d+\.?\d*)%')
+_ONLY_PERCENT_RE = re.compile(r'^\d+\.?\d*%$')
+_MONTH_PREFIX_RE = re.compile(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)')
+_NUMBERED_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_TITLE_NUMBER_PREFIX_RE = re.compile(r'^\d+[\.\)\:]\s*')
+_TITLE_TRAILING_COLONS_RE = re.compile(r':+\s*$')
+_TITLE_REPEATED_COLONS_RE = re.compile(r'\s*:+\s*:')
+# Summary rows: "Total", "Course Total", "Subtotal", "Sum", "Grand Total" as the whole name
+_SUMMARY_ROW_RE = re.compile(r'^(?:(course\s+)?total$|subtotal$|sum$|grand\s+total$)', re.IGNORECASE)
+_ROUND_TOTAL_WEIGHT_RE = re.compile(r'^\d{2,3}(\.00)?%$')
+
+# Free-form due date text
+_OPENS_DUE_RE = re.compile(r'Opens\s+[^D]*Due\s+([^\.]+)', re.IGNORECASE)
+_DAY_RANGE_RE = re.compile(r'(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?\s*[/-]\s*(\d{1,2})(?:st|nd|rd|th)?', re.IGNORECASE)
+# Complete dates in a known format, built directly instead of going through dateparser
+_FULL_MONTH_DATE_RE = re.compile(r'([A-Za-z]+)\.?\s+(\d{1,2}),?\s+(\d{4})')
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_CLOCK_TIME_RE = re.compile(r'(\d{1,2})(?:[:–-](\d{2}))?\s*(AM|PM|am|pm)', re.IGNORECASE)
+_MONTH_DAY_FALLBACK_PATTERNS = [
+    re.compile(r'(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday),?\s+(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?', re.IGNORECASE),
+    re.compile(r'(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?', re.IGNORECASE),
+    re.compile(r'Due\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+(\w+)\s+(\d{1,2})', re.IGNORECASE),
+]
+
+
+def _to_24_hour(hour: int, ampm: str) -> int:
+    """Convert a 12-hour clock hour with its am/pm marker to a 24-hour clock hour."""
+    if ampm.lower() == 'pm' and hour != 12:
+        return hour + 12
+    if ampm.lower() == 'am' and hour == 12:
+        return 0
+    return hour
+
+
+@lru_cache(maxsize=256)
+def _days_mask(days_str: str) -> int:
+    """Parse day abbreviations ("MWF", "TTh", "Mon/Wed/Fri") into a bitmask (bit n = weekday n).
+    
+    Scans the string once for day tokens (see _DAY_TOKEN_RE); anything else,
+    such as the slashes in "M/W/F", is skipped. Memoized: outlines repeat the
+    same few day strings across sections.
+    """
+    mask = 0
+    # Convert to uppercase for case-insensitive matching
+    for token in _DAY_TOKEN_RE.findall(days_str.upper()):
+        mask |= _DAY_ABBREVIATION_BITS[token[:3]]
+    return mask
+
+
+def _schedule_key(days: List[int], start: time, end: time) -> int:
+    """Pack a meeting's days and start/end times into one int for deduplication.
+    
+    Bits 32-38 hold the day mask (bit n = weekday n); bits 16-31 and 0-15 the start
+    and end as minutes since midnight. Equal meetings get equal keys.
+    """
+    day_mask = 0
+    for day in days:
+        day_mask |= 1 << day
+    return (day_mask << 32) | ((start.hour * 60 + start.minute) << 16) | (end.hour * 60 + end.minute)
+
+
+def _normalize_title_key(title: str) -> str:
+    """Normalize an assessment title for deduplication.
+    
+    Drops an "In Class" prefix, collapses whitespace and reduces the title to
+    its core, e.g. "In Class Quiz 1 (Online)" -> "quiz 1", "Final Exam" -> "final".
+    
+    Args:
+        title: Assessment title
+        
+    Returns:
+        Lowercased comparison key
+    """
+    normalized = title.lower().strip()
+    normalized = _IN_CLASS_PREFIX_RE.sub('', normalized)
+    normalized = _WHITESPACE_RUN_RE.sub(' ', normalized)
+    # Look for number anywhere after the type (not just immediately after)
+    match = _TITLE_CORE_NUMBER_RE.search(normalized)
+    if match:
+        return f"{match.group(1)} {match.group(2)}"
+    # No number found, just extract the type
+    return _TITLE_CORE_TYPE_RE.sub(r'\1', normalized).strip()
+
+
+@lru_cache(maxsize=512)
+def _clean_title(title: str) -> str:
+    """Clean up an assessment title (see PDFExtractor._clean_assessment_title), memoized.
+    
+    Titles come from a small vocabulary ("Midterm Test", "Final Exam", "Quiz 1"...)
+    and are cleaned again for every row and date they appear with, so results are
+    cached by input string.
+    """
+    if not title:
+        return title
+    
+    # Remove leading numbers and punctuation like "1. ", "2) ", "1: "
+    cleaned = _TITLE_NUMBER_PREFIX_RE.sub('', title)
+    
+    # Remove trailing colons and extra punctuation
+    cleaned = _TITLE_TRAILING_COLONS_RE.sub('', cleaned)
+    cleaned = _TITLE_REPEATED_COLONS_RE.sub(':', cleaned)  # Multiple colons to single
+    
+    # Clean up whitespace
+    cleaned = ' '.join(cleaned.split())
+    
+    return cleaned.strip()
+
+
+@lru_cache(maxsize=512)
+def _classify_title(text: str) -> str:
+    """Classify an assessment type from its title (first matching _ASSESSMENT_TYPE_RULES needle), memoized."""
+    text_lower = text.lower()
+    for needle, assessment_type in _ASSESSMENT_TYPE_RULES:
+        if needle in text_lower:
+            return assessment_type
+    return "other"
+
+
+def _date_from_parts(month: str, day: str, year: int) -> Optional[date]:
+    """Build a date from a month name, day number and year.
+    
+    Args:
+        month: Month name or abbreviation (e.g. "Oct", "October")
+        day: Day of month as text (e.g. "27")
+        year: Four-digit year
+        
+    Returns:
+        The date, or None if the month is unknown or the day is out of range
+    """
+    month_num = _MONTH_NUMBERS.get(month.lower().rstrip('.'))
+    if month_num is None or not day.isdecimal():
+        parsed = _parse_date_cached(f"{month} {day}, {year}")
+        return parsed.date() if parsed else None
+    try:
+        return date(year, month_num, int(day))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _parse_known_date(date_str: str) -> Optional[date]:
+    """Parse a date string that is exactly "Month D, YYYY" or "YYYY-MM-DD".
+    
+    These are the common formats in outlines, and building them directly is
+    much faster than dateparser, which is kept for everything else.
+    
+    Args:
+        date_str: Date string to parse
+        
+    Returns:
+        The date, or None if the string is not in one of these formats or is invalid
+    """
+    match = _FULL_MONTH_DATE_RE.fullmatch(date_str)
+    if match:
+        month_num = _MONTH_NUMBERS.get(match.group(1).lower())
+        if month_num is None:
+            return None
+        year, day = int(match.group(3)), int(match.group(2))
+    else:
+        match = _ISO_DATE_RE.fullmatch(date_str)
+        if not match:
+            return None
+        year, month_num, day = (int(group) for group in match.groups())
+    try:
+        return date(year, month_num, day)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a date string with dateparser, memoized.
+    
+    Syllabi repeat the same date strings across assessments (e.g. "December 15, 2025"),
+    and dateparser is slow, so parsed results are cached by input string.
+    
+    Args:
+        date_str: Date string to parse
+        
+    Returns:
+        Parsed datetime, or None if dateparser could not parse it
+    """
+    return dateparser.parse(date_str)
+
+
+# Month spellings recognised by the assessment date scanner
+_SCAN_MONTHS = frozenset([
+    'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+    'january', 'february', 'march', 'april', 'june', 'july', 'august',
+    'september', 'october', 'november', 'december',
+])
+# Word and number tokens for the date scanner ("Sunday,Oct 19th" -> Sunday, Oct, 19, th)
+_DATE_TOKEN_RE = re.compile(r'[A-Za-z]+|\d+')
+_SCAN_WEEKDAYS = frozenset([
+    'sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday',
+])
+
+
+def _scan_month_day_dates(text: str) -> List[Tuple[str, str]]:
+    """Find "Month Day" dates ("Oct 1", "Oct. 1st", "Sunday, Oct 19") in text.
+    
+    Walks the text's word and number tokens once instead of running
+    month-alternation regexes over it. Tokens are split on any other character,
+    so punctuation glued to a month ("Due:Oct 19", "Oct 19-Oct 21") doesn't hide
+    it. As with the patterns this replaced, the day must follow the month after
+    whitespace (optionally after a "."), and a weekday must precede it after
+    whitespace (optionally after a ","). Dates preceded by a weekday are returned
+    first, then the remaining dates, each group in text order.
+    
+    Args:
+        text: Text to scan (e.g. an assessment table row)
+        
+    Returns:
+        List of (month, day) tuples, with the month as written in the text
+    """
+    weekday_dates = []
+    other_dates = []
+    tokens = list(_DATE_TOKEN_RE.finditer(text))
+    for idx in range(len(tokens) - 1):
+        month_token = tokens[idx]
+        month = month_token.group()
+        if month.lower() not in _SCAN_MONTHS:
+            continue
+        
+        # Day is the next token, 1-2 digits ("19", "19th", "19,"; not the "2025" in "Oct 2025")
+        day_token = tokens[idx + 1]
+        day = day_token.group()
+        if len(day) > 2 or not day.isdecimal():
+            continue
+        if not _is_separator(text[month_token.end():day_token.start()], '.'):
+            continue
+        
+        if idx > 0 and tokens[idx - 1].group().lower() in _SCAN_WEEKDAYS and \
+           _is_separator(text[tokens[idx - 1].end():month_token.start()], ','):
+            weekday_dates.append((month, day))
+        else:
+            other_dates.append((month, day))
+    
+    return weekday_dates + other_dates
+
+
+def _is_separator(gap: str, punctuation: str) -> bool:
+    """Tell whether the text between two tokens is whitespace, optionally after one punctuation mark."""
+    if gap.startswith(punctuation):
+        gap = gap[1:]
+    return gap.isspace()
+
+
+def _find_text_evaluation_section(text: str) -> int:
+    """Find where the plain-text grade breakdown section starts.
+    
+    Same result as searching for _EVALUATION_HEADING_RE and then each of
+    _TEXT_EVALUATION_SECTION_PATTERNS in order, but the first (and by far most
+    common) heading is located with str.find on the lowercased text, and the
+    other patterns only run when their required word occurs at all.
+    
+    Args:
+        text: Full text of the PDF
+        
+    Returns:
+        Offset of the section heading in text, or -1 if there is none
+    """
+    text_lower = text.lower()
+    if len(text_lower) == len(text):
+        pos = text_lower.find('evaluation')
+        while pos != -1:
+            end = pos + len('evaluation')
+            # "Evaluation" must end a word ("Evaluations" doesn't count)
+            if end == len(text_lower) or not (text_lower[end].isalnum() or text_lower[end] == '_'):
+                # Include a preceding "Methods of" (whitespace-separated) in the heading
+                of_end = pos
+                while of_end and text_lower[of_end - 1].isspace():
+                    of_end -= 1
+                if of_end < pos and text_lower.endswith('of', 0, of_end):
+                    methods_end = of_end - 2
+                    while methods_end and text_lower[methods_end - 1].isspace():
+                        methods_end -= 1
+                    if methods_end < of_end - 2 and text_lower.endswith('methods', 0, methods_end):
+                        return methods_end - len('methods')
+                return pos
+            pos = text_lower.find('evaluation', end)
+    else:
+        # Lowercasing changed the length (rare non-ASCII text), so offsets wouldn't line up
+        match = _EVALUATION_HEADING_RE.search(text)
+        if match:
+            return match.start()
+    
+    for literals, pattern in _TEXT_EVALUATION_SECTION_PATTERNS:
+        if not any(literal in text_lower for literal in literals):
+            continue
+        match = pattern.search(text)
+        if match:
+            return match.start()
+    return -1
+
+
+def _extract_pages_text(args: Tuple[str, List[int]]) -> List[Tuple[int, Optional[str]]]:
+    """Extract the text of some pages of a PDF (process pool worker).
+    
+    Args:
+        args: Tuple of (pdf_path, 0-based page indices)
+        
+    Returns:
+        List of (page index, text) pairs
+    """
+    pdf_path, indices = args
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in indices:
+            page = pdf.pages[index]
+            results.append((index, page.extract_text()))
+            page.close()
+    return results
+
+
+def _extract_pages_tables(args: Tuple[str, List[int]]) -> List[Tuple[int, List[List[List[Optional[str]]]]]]:
+    """Extract the tables of some pages of a PDF (process pool worker).
+    
+    Args:
+        args: Tuple of (pdf_path, 0-based page indices)
+        
+    Returns:
+        List of (page index, tables) pairs
+    """
+    pdf_path, indices = args
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in indices:
+            page = pdf.pages[index]
+            results.append((index, page.extract_tables()))
+            page.close()
+    return results
+
+
+def _parallel_page_chunks(missing: List[int]) -> List[List[int]]:
+    """Split unread page indices into contiguous ranges, one per worker process.
+    
+    Returns an empty list when there are too few pages (or CPUs) for a process
+    pool to pay off, in which case the caller reads the pages itself.
+    """
+    workers = min(os.cpu_count() or 1, len(missing) // (PARALLEL_PAGE_THRESHOLD // 2))
+    if len(missing) < PARALLEL_PAGE_THRESHOLD or workers <= 1:
+        return []
+    chunk_size = -(-len(missing) // workers)
+    return [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
 
 
 class PDFExtractor:
     """Extracts course information from PDF course outlines."""
     
-    def __init__(self, pdf_path: Path):
+    # Every attribute an extractor sets, including the debug info stored by
+    # _extract_with_document_structure (probed with hasattr before use)
+    __slots__ = (
+        'pdf_path', '_content_hash', '_pdf', '_num_pages', '_page_text_cache',
+        '_page_tables_cache', '_tables_lock', '_parallel_pages', '_joined_text_cache', '_sections',
+        '_doc_structure', '_assessment_debug', '_course_debug', '_assessment_source',
+    )
+    
+    def __init__(self, pdf_path: Path, force_refresh: bool = False, parallel_pages: bool = False,
+                 pdf_hash: Optional[str] = None):
         """Initialize extractor with PDF path.
         
         Args:
             pdf_path: Path to PDF file
+            force_refresh: Re-extract page text and tables even if this PDF was read before
+            parallel_pages: Read the pages of large PDFs in a process pool (see _read_all_pages).
+                Off by default: forking a web server worker that has other request threads
+                running is unsafe, so only single-threaded callers such as the CLI enable it
+            pdf_hash: compute_pdf_hash of the file, if the caller already has it. Only for
+                callers whose file can't be replaced in between (the CLI): a stale hash
+                would file this file's pages under another PDF's _PAGE_CACHE entry.
+                The web app, where uploads can overwrite each other, leaves it None
             
         Raises:
             ValueError: If file is too large
         """
         self.pdf_path = Path(pdf_path)
-        self.pages_text = []
+        # Page text is extracted lazily, one page at a time, and cached by page index
+        self._pdf = None
+        self._num_pages = 0
+        self._page_text_cache: Dict[int, Optional[str]] = {}
+        # pdfplumber tables per page index, shared by the schedule and assessment table scans
+        self._page_tables_cache: Dict[int, List[List[List[Optional[str]]]]] = {}
+        self._tables_lock = threading.Lock()
+        self._parallel_pages = parallel_pages
+        # Joined text of the first N non-empty pages (None = all pages), see _joined_text
+        self._joined_text_cache: Dict[Optional[int], str] = {}
+        # (lectures, labs), filled by _extract_sections on first use
+        self._sections: Optional[Tuple[List[SectionOption], List[SectionOption]]] = None
         
         # Check file size
         if self.pdf_path.exists():
@@ -54,15 +876,153 @@ class PDFExtractor:
             if size_mb > MAX_FILE_SIZE_MB:
                 raise ValueError(f"PDF too large ({size_mb:.1f}MB). Maximum is {MAX_FILE_SIZE_MB}MB.")
         
-        self._load_pdf()
+        # Reuse page text and tables from an earlier extractor for the same file contents
+        self._content_hash = pdf_hash or compute_pdf_hash(self.pdf_path)
+        cached = None if force_refresh else _PAGE_CACHE.get(self._content_hash)
+        if cached is not None:
+            self._num_pages, self._page_text_cache, self._page_tables_cache, self._tables_lock = cached
+        else:
+            self._load_pdf()
+            with _PAGE_CACHE_LOCK:
+                if self._content_hash not in _PAGE_CACHE and len(_PAGE_CACHE) >= PAGE_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order); a force_refresh
+                    # of a cached PDF only replaces its own entry
+                    del _PAGE_CACHE[next(iter(_PAGE_CACHE))]
+                _PAGE_CACHE[self._content_hash] = (
+                    self._num_pages, self._page_text_cache, self._page_tables_cache, self._tables_lock
+                )
     
     def _load_pdf(self):
-        """Load PDF and extract text page by page."""
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text()
-                if text:
-                    self.pages_text.append((page_num, text))
+        """Open the PDF. Page text is extracted on demand by _iter_pages_text."""
+        self._pdf = pdfplumber.open(self.pdf_path)
+        self._num_pages = len(self._pdf.pages)
+    
+    def close(self):
+        """Close the PDF file. Page text that was already extracted stays available."""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _page_text(self, index: int) -> Optional[str]:
+        """Get the text of one page (0-based index), extracting and caching it on first use."""
+        if index not in self._page_text_cache:
+            if self._pdf is None:
+                self._load_pdf()
+            page = self._pdf.pages[index]
+            self._page_text_cache[index] = page.extract_text()
+            # Free pdfplumber's cached layout objects for this page to bound memory
+            page.close()
+            # Every page has been read, so the file handle is no longer needed
+            if len(self._page_text_cache) >= self._num_pages:
+                self.close()
+        return self._page_text_cache[index]
+    
+    def _read_all_pages(self):
+        """Extract the text of every page not read yet.
+        
+        pdfplumber text extraction is CPU-bound and independent per page, so
+        with parallel_pages enabled, large PDFs are split into contiguous page
+        ranges and read by a process pool, each worker opening the file itself.
+        Otherwise (and for small PDFs, single-core machines, or a pool that
+        fails to start or dies) the pages are read one by one here.
+        """
+        missing = [index for index in range(self._num_pages) if index not in self._page_text_cache]
+        chunks = _parallel_page_chunks(missing) if self._parallel_pages else []
+        if chunks:
+            try:
+                with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                    for results in executor.map(_extract_pages_text, [(str(self.pdf_path), chunk) for chunk in chunks]):
+                        self._page_text_cache.update(results)
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Parallel page extraction failed, reading pages sequentially: {e}")
+        
+        for _ in self._iter_pages_text():
+            pass
+        self.close()
+    
+    def _read_all_tables(self):
+        """Extract the tables of every page not read yet, in a process pool for large PDFs.
+        
+        Table detection is pdfplumber's most expensive step and is independent per
+        page, so, as in _read_all_pages, with parallel_pages enabled large PDFs are
+        split into contiguous page ranges handled by worker processes. Anything the
+        pool didn't cover (parallel_pages off, small PDFs, single-core machines, a
+        pool that fails to start or dies) is left for _page_tables to extract on demand.
+        """
+        if not self._parallel_pages:
+            return
+        with self._tables_lock:
+            missing = [index for index in range(self._num_pages) if index not in self._page_tables_cache]
+        chunks = _parallel_page_chunks(missing)
+        if not chunks:
+            return
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                for results in executor.map(_extract_pages_tables, [(str(self.pdf_path), chunk) for chunk in chunks]):
+                    with self._tables_lock:
+                        for index, tables in results:
+                            self._page_tables_cache.setdefault(index, tables)
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Parallel table extraction failed, reading tables on demand: {e}")
+    
+    def _page_tables(self, index: int) -> List[List[List[Optional[str]]]]:
+        """Get the tables of one page (0-based index), extracting and caching them on first use.
+        
+        The schedule and assessment table scans both read tables through here, so
+        each page's tables are extracted once per PDF (the cache is shared with later
+        extractors for the same file contents, see _PAGE_CACHE). Locked because those
+        scans run in parallel threads (see _run_legacy_extractors) and share this PDF
+        handle; the lock comes from the cache entry, so extractors sharing the tables
+        dict also share its lock.
+        """
+        with self._tables_lock:
+            if index not in self._page_tables_cache:
+                if self._pdf is None:
+                    self._load_pdf()
+                page = self._pdf.pages[index]
+                self._page_tables_cache[index] = page.extract_tables()
+                # Tables are plain lists now; free the page's chars/layout objects
+                page.close()
+            return self._page_tables_cache[index]
+    
+    def _iter_pages_text(self, max_pages: Optional[int] = None):
+        """Yield (page_num, text) for non-empty pages, extracting them lazily.
+        
+        Args:
+            max_pages: Stop after this many non-empty pages (None for the whole document)
+        """
+        found = 0
+        for index in range(self._num_pages):
+            if max_pages is not None and found >= max_pages:
+                return
+            text = self._page_text(index)
+            if text:
+                found += 1
+                yield index + 1, text
+    
+    def _joined_text(self, max_pages: Optional[int] = None) -> str:
+        """Get the text of the first max_pages non-empty pages joined by newlines.
+        
+        Cached per page count, so each extractor that searches the same page span
+        reuses one string instead of building its own.
+        
+        Args:
+            max_pages: Number of non-empty pages to join (None for the whole document)
+        """
+        if max_pages not in self._joined_text_cache:
+            self._joined_text_cache[max_pages] = "\n".join([text for _, text in self._iter_pages_text(max_pages)])
+        return self._joined_text_cache[max_pages]
+    
+    @property
+    def pages_text(self) -> List[Tuple[int, str]]:
+        """(page_num, text) for every non-empty page. Extracts any pages not yet read."""
+        return list(self._iter_pages_text())
     
     def extract_all(self) -> ExtractedCourseData:
         """Extract all course information from PDF.
@@ -70,16 +1030,19 @@ class PDFExtractor:
         Returns:
             ExtractedCourseData with term, sections, and assessments
         """
-        # Try new document structure-based extraction first
-        if HAS_NEW_EXTRACTORS:
-            try:
-                return self._extract_with_document_structure()
-            except Exception as e:
-                # Fall back to legacy extraction if new method fails
-                print(f"Document structure extraction failed, using legacy: {e}")
-        
-        # Legacy extraction
-        return self._extract_legacy()
+        try:
+            # Try new document structure-based extraction first
+            if HAS_NEW_EXTRACTORS:
+                try:
+                    return self._extract_with_document_structure()
+                except Exception as e:
+                    # Fall back to legacy extraction if new method fails
+                    print(f"Document structure extraction failed, using legacy: {e}")
+            
+            # Legacy extraction
+            return self._extract_legacy()
+        finally:
+            self.close()
     
     def _extract_with_document_structure(self) -> ExtractedCourseData:
         """Extract using the new document structure layer.
@@ -101,13 +1064,6 @@ class PDFExtractor:
         # Store for debugging
         self._doc_structure = doc_structure
         
-        # Extract term (still using legacy method - works well)
-        term = self.extract_term()
-        
-        # Extract lecture/lab sections (still using legacy - schedules not in PDFs)
-        lecture_sections = self.extract_lecture_sections()
-        lab_sections = self.extract_lab_sections()
-        
         # Extract assessments using BOTH methods, pick best result
         # New pipeline (pass pdf_path for raw text extraction fallback)
         assessment_extractor = AssessmentExtractor(doc_structure, pdf_path=self.pdf_path)
@@ -117,14 +1073,23 @@ class PDFExtractor:
         # Store debug info
         self._assessment_debug = assessment_extractor.get_debug_info()
         
-        # Legacy pipeline
-        legacy_assessments = self.extract_assessments()
-        legacy_weight = sum(a.weight_percent or 0 for a in legacy_assessments)
-        
         # Choose best result based on:
         # 1. Weight closest to 100
         # 2. Number of assessments (more is better if weights are similar)
         new_score = self._score_assessment_quality(new_assessments, new_weight)
+        
+        # Term and lecture/lab sections still use the legacy methods (they work well and
+        # schedules are rarely in PDFs). Legacy assessments are only computed for comparison
+        # when the new pipeline's result isn't already a confident one (weights ~100%,
+        # several named assessments). Scores go up to 90, so a skipped legacy result
+        # could have scored higher; at 75+ the new result is kept regardless.
+        run_legacy_assessments = new_score < HIGH_CONFIDENCE_ASSESSMENT_SCORE
+        term, lecture_sections, lab_sections, legacy_assessments = self._run_legacy_extractors(
+            include_assessments=run_legacy_assessments
+        )
+        
+        # Legacy pipeline
+        legacy_weight = sum(a.weight_percent or 0 for a in legacy_assessments)
         legacy_score = self._score_assessment_quality(legacy_assessments, legacy_weight)
         
         if new_score >= legacy_score:
@@ -141,15 +1106,12 @@ class PDFExtractor:
         # Store debug info
         self._course_debug = course_extractor.get_debug_info()
         
-        # Fallback for course code if new method didn't find it
-        if not course_code:
-            legacy_code, _ = self.extract_course_info()
-            course_code = legacy_code
-        
-        # Fallback for course name
-        if not course_name:
-            _, legacy_name = self.extract_course_info()
-            course_name = legacy_name
+        # Fallback for course code and/or name if new method didn't find them
+        # (one legacy pass over the first page serves both)
+        if not course_code or not course_name:
+            legacy_code, legacy_name = self.extract_course_info()
+            course_code = course_code or legacy_code
+            course_name = course_name or legacy_name
         
         return ExtractedCourseData(
             term=term,
@@ -188,14 +1150,19 @@ class PDFExtractor:
             distance = abs(100 - total_weight)
             score += max(0, 20 - distance * 0.3)
         
-        # Count of valid assessments (those with weights)
-        valid_count = sum(1 for a in assessments if a.weight_percent and a.weight_percent > 0)
+        # Count valid assessments (those with weights) and common assessment types
+        # in one pass over the assessments
+        valid_count = 0
+        type_matches = 0
+        for a in assessments:
+            if a.weight_percent and a.weight_percent > 0:
+                valid_count += 1
+            if _has_common_assessment_type(a.title.lower()):
+                type_matches += 1
+        
         score += min(valid_count * 5, 25)  # Up to 25 points for 5+ assessments
         
         # Bonus for having common assessment types
-        common_types = {'exam', 'midterm', 'final', 'quiz', 'assignment', 'lab', 'test'}
-        type_matches = sum(1 for a in assessments 
-                          if any(t in a.title.lower() for t in common_types))
         score += min(type_matches * 3, 15)  # Up to 15 points
         
         return score
@@ -206,10 +1173,7 @@ class PDFExtractor:
         Returns:
             ExtractedCourseData with term, sections, and assessments
         """
-        term = self.extract_term()
-        lecture_sections = self.extract_lecture_sections()
-        lab_sections = self.extract_lab_sections()
-        assessments = self.extract_assessments()
+        term, lecture_sections, lab_sections, assessments = self._run_legacy_extractors()
         
         # Try to extract course code and name
         course_code, course_name = self.extract_course_info()
@@ -223,6 +1187,46 @@ class PDFExtractor:
             course_name=course_name
         )
     
+    def _run_legacy_extractors(self, include_assessments: bool = True) -> Tuple[CourseTerm, List[SectionOption], List[SectionOption], List[AssessmentTask]]:
+        """Run the term, section and assessment extractors concurrently.
+        
+        The extractors only read page text and page tables, so they are
+        independent of each other. The page text they need is extracted up
+        front so the worker threads only read the cache: every page when the
+        assessment extractor runs, otherwise just the pages the term and section
+        extractors search. When the assessment extractor runs (it reads every
+        page's tables), tables are prefetched up front too; otherwise they are
+        extracted on demand through _page_tables, which serializes access to the
+        open PDF.
+        
+        Args:
+            include_assessments: Run the legacy assessment extractor (returns [] if False)
+            
+        Returns:
+            Tuple of (term, lecture_sections, lab_sections, assessments)
+        """
+        if include_assessments:
+            self._read_all_pages()
+            # Before this extractor's threads start (the pool only runs with
+            # parallel_pages, which callers sharing the process with other threads leave off)
+            self._read_all_tables()
+        else:
+            # Covers the first 3 pages extract_term searches and every page the
+            # schedule table scan reads (its first MAX_PAGES_TO_SEARCH)
+            self._joined_text(MAX_PAGES_TO_SEARCH)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            term = executor.submit(self.extract_term)
+            sections = executor.submit(self._extract_sections)
+            assessments = executor.submit(self.extract_assessments) if include_assessments else None
+            lecture_sections, lab_sections = sections.result()
+            return (
+                term.result(),
+                list(lecture_sections),
+                list(lab_sections),
+                assessments.result() if assessments is not None else [],
+            )
+    
     def get_extraction_debug(self) -> Dict[str, Any]:
         """Get debug information about the extraction process.
         
@@ -269,64 +1273,37 @@ class PDFExtractor:
         """
         # Search first 3 pages for term information
         # Most course outlines have term info on the first page or two
-        search_text = "\n".join([text for _, text in self.pages_text[:3]])
+        search_text = self._joined_text(3)
         
         # Pattern for term name - look for "Fall 2026", "Winter Term 2027", etc.
         # These patterns match common ways term names are written in course outlines
-        term_patterns = [
-            r'(Fall|Winter|Summer)\s+(\d{4})',  # "Fall 2026"
-            r'(Fall|Winter|Summer)\s+Term\s+(\d{4})',  # "Fall Term 2026"
-            r'(Fall|Winter|Summer)\s+Semester\s+(\d{4})',  # "Fall Semester 2026"
-        ]
-        
         term_name = None
+        season = None
+        year = None
         # Try each pattern until we find a match
-        for pattern in term_patterns:
-            match = re.search(pattern, search_text, re.IGNORECASE)
+        for pattern in _TERM_NAME_PATTERNS:
+            match = pattern.search(search_text)
             if match:
                 # Combine the season and year (e.g., "Fall 2026")
                 term_name = f"{match.group(1)} {match.group(2)}"
+                # The patterns are case-insensitive, so "FALL 2026" and "fall term 2026"
+                # count too; title-case the season to look up its default dates
+                season = match.group(1).title()
+                year = int(match.group(2))
                 break
         
-        # Pattern for date ranges - look for "September 1 - December 15, 2026"
-        # or "2026-09-01 - 2026-12-15" format
-        date_range_patterns = [
-            r'(September|October|November|December|January|February|March|April|May|June|July|August)\s+(\d{1,2})\s*[-–]\s*(September|October|November|December|January|February|March|April|May|June|July|August)\s+(\d{1,2}),?\s+(\d{4})',
-            r'(\d{4})-(\d{2})-(\d{2})\s*[-–]\s*(\d{4})-(\d{2})-(\d{2})',
-        ]
-        
+        # Explicit date ranges ("September 1 - December 15, 2026") aren't parsed yet,
+        # so the dates come from the season defaults below
         start_date = None
         end_date = None
         
-        # Try to find date ranges in the text
-        for pattern in date_range_patterns:
-            match = re.search(pattern, search_text, re.IGNORECASE)
-            if match:
-                # Try to parse dates using dateparser library
-                # This handles various date formats automatically
-                date_str = match.group(0)
-                dates = dateparser.parse(date_str, fuzzy=True)
-                if dates:
-                    # This is a simplified approach - may need refinement
-                    # For now, we'll infer dates from term name if this doesn't work
-                    pass
-        
         # If term name found but dates missing, try to infer from term name
         # For example, "Fall 2026" typically means September to December
         if term_name and not start_date:
-            year_match = re.search(r'\d{4}', term_name)
-            if year_match:
-                year = int(year_match.group(0))
-                # Set default dates based on term type
-                if "Fall" in term_name:
-                    start_date = date(year, 9, 1)  # September 1
-                    end_date = date(year, 12, 15)  # December 15
-                elif "Winter" in term_name:
-                    start_date = date(year, 1, 8)  # January 8
-                    end_date = date(year, 4, 30)  # April 30
-                elif "Summer" in term_name:
-                    start_date = date(year, 5, 1)  # May 1
-                    end_date = date(year, 8, 31)  # August 31
+            # Set default dates based on term type
+            (start_month, start_day), (end_month, end_day) = _SEASON_RANGES[season]
+            start_date = date(year, start_month, start_day)
+            end_date = date(year, end_month, end_day)
         
         # If still missing, return with placeholder values
         # The caller (main.py or app.py) will prompt the user to fill these in
@@ -352,77 +1329,7 @@ class PDFExtractor:
         Returns:
             List of SectionOption objects for lectures
         """
-        sections = []
-        # Search for schedule section (usually in first few pages)
-        search_text = "\n".join([text for _, text in self.pages_text[:MAX_PAGES_TO_SEARCH]])
-        
-        # Try table-based extraction first
-        table_sections = self._extract_schedule_from_tables("lecture")
-        if table_sections:
-            return table_sections
-        
-        # Try text-based extraction
-        text_sections = self._extract_schedule_from_text("lecture", search_text)
-        if text_sections:
-            return text_sections
-        
-        # Legacy pattern matching (keeping existing logic as fallback)
-        schedule_patterns = [
-            r'Lecture\s+([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})\s*(?:AM|PM)?',
-            r'([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})\s*(?:AM|PM)?',
-            r'(?:Lecture|LEC|Class|Section)\s*(\d{3})?\s*[:\s]+([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})',
-            r'(?:Lecture|LEC)\s*([MTWThFS]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})',
-        ]
-        
-        matches = []
-        for pattern in schedule_patterns:
-            for match in re.finditer(pattern, search_text, re.IGNORECASE):
-                matches.append(match)
-        
-        for match in matches:
-            # Handle different pattern groups
-            groups = match.groups()
-            try:
-                if len(groups) == 6:  # First pattern with section ID
-                    section_id = groups[0] or ""
-                    days_str = groups[1]
-                    start_hour = int(groups[2])
-                    start_min = int(groups[3])
-                    end_hour = int(groups[4])
-                    end_min = int(groups[5])
-                elif len(groups) == 4:  # Second/third pattern without section ID
-                    section_id = ""
-                    days_str = groups[0]
-                    start_hour = int(groups[1])
-                    start_min = int(groups[2])
-                    end_hour = int(groups[3])
-                    end_min = int(groups[4])
-                else:
-                    continue
-                
-                # Parse days of week
-                days_of_week = self._parse_days_of_week(days_str)
-                if not days_of_week:
-                    continue  # Skip if we couldn't parse days
-                
-                # Determine AM/PM (simplified - may need refinement)
-                start_time = time(start_hour % 24, start_min)
-                end_time = time(end_hour % 24, end_min)
-                
-                section = SectionOption(
-                    section_type="Lecture",
-                    section_id=section_id,
-                    days_of_week=days_of_week,
-                    start_time=start_time,
-                    end_time=end_time,
-                    location=None  # Extract location if pattern found
-                )
-                sections.append(section)
-            except (ValueError, IndexError) as e:
-                # Skip matches that don't parse correctly
-                continue
-        
-        return sections
+        return list(self._extract_sections()[0])
     
     def extract_lab_sections(self) -> List[SectionOption]:
         """Extract lab section schedules using multi-pattern matching.
@@ -430,68 +1337,93 @@ class PDFExtractor:
         Returns:
             List of SectionOption objects for labs (empty if course has no labs)
         """
-        sections = []
-        search_text = "\n".join([text for _, text in self.pages_text[:MAX_PAGES_TO_SEARCH]])
-        
-        # Try table-based extraction first
-        table_sections = self._extract_schedule_from_tables("lab")
-        if table_sections:
-            return table_sections
-        
-        # Try text-based extraction
-        text_sections = self._extract_schedule_from_text("lab", search_text)
-        if text_sections:
-            return text_sections
-        
-        # Legacy pattern matching (keeping existing logic as fallback)
-        lab_patterns = [
-            r'(?:Lab|LAB|Laboratory|Tutorial|TUT)\s*(\d{3})?\s*[:\s]+([M/T/W/Th/F/S]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})',
-            r'(?:Lab|LAB|Laboratory|Tutorial|TUT)\s*([MTWThFS]+)\s+(\d{1,2}):(\d{2})\s*[-–]\s*(\d{1,2}):(\d{2})',
-        ]
+        return list(self._extract_sections()[1])
+    
+    def _extract_sections(self) -> Tuple[List[SectionOption], List[SectionOption]]:
+        """Extract lecture and lab sections together.
+        
+        The schedule text, the table scan and the shared day/time patterns are
+        built and run once for both section types. Each type then uses the
+        first strategy that finds something: tables, text patterns, legacy patterns.
+        The result is cached per instance.
         
-        matches = []
-        for pattern in lab_patterns:
-            for match in re.finditer(pattern, search_text, re.IGNORECASE):
-                matches.append(match)
+        Returns:
+            Tuple of (lecture sections, lab sections)
+        """
+        if self._sections is not None:
+            return self._sections
+        
+        # Search for schedule section (usually in first few pages)
+        search_text = self._joined_text(MAX_PAGES_TO_SEARCH)
+        table_sections = self._extract_schedule_from_tables()
+        text_sections = None
+        
+        result = []
+        for section_type in ("lecture", "lab"):
+            # Try table-based extraction first
+            sections = table_sections[section_type]
+            if not sections:
+                # Try text-based extraction
+                if text_sections is None:
+                    text_sections = self._extract_schedule_from_text(search_text)
+                sections = text_sections[section_type]
+            if not sections:
+                # Legacy pattern matching (keeping existing logic as fallback)
+                sections = self._extract_sections_legacy(section_type, search_text)
+            result.append(sections)
+        
+        self._sections = (result[0], result[1])
+        return self._sections
+    
+    def _extract_sections_legacy(self, section_type: str, search_text: str) -> List[SectionOption]:
+        """Legacy schedule patterns (last-resort fallback).
+        
+        Args:
+            section_type: "lecture" or "lab"
+            search_text: Text to search in
+            
+        Returns:
+            List of SectionOption objects
+        """
+        pattern, group_slices, literals = _LEGACY_SCHEDULE_FAMILIES[section_type]
+        search_lower = search_text.lower()
+        if not any(literal in search_lower for literal in literals):
+            return []
         
-        for match in matches:
-            groups = match.groups()
+        sections = []
+        # One scan for the whole pattern family; lastgroup tells which alternative matched
+        for match in pattern.finditer(search_text):
+            first_group, end_group = group_slices[match.lastgroup]
+            groups = match.groups()[first_group:end_group]
+            # Handle different pattern groups
+            if len(groups) == 6:  # Pattern with section ID
+                section_id = groups[0] or ""
+                groups = groups[1:]
+            else:
+                section_id = ""
+            days_str, start_hour, start_min, end_hour, end_min = groups
+            
             try:
-                if len(groups) == 5:
-                    section_id = groups[0] or ""
-                    days_str = groups[1]
-                    start_hour = int(groups[2])
-                    start_min = int(groups[3])
-                    end_hour = int(groups[4])
-                    end_min = int(groups[5])
-                elif len(groups) == 4:
-                    section_id = ""
-                    days_str = groups[0]
-                    start_hour = int(groups[1])
-                    start_min = int(groups[2])
-                    end_hour = int(groups[3])
-                    end_min = int(groups[4])
-                else:
-                    continue
-                
+                # Parse days of week
                 days_of_week = self._parse_days_of_week(days_str)
                 if not days_of_week:
-                    continue
-                
-                start_time = time(start_hour % 24, start_min)
-                end_time = time(end_hour % 24, end_min)
+                    continue  # Skip if we couldn't parse days
                 
-                section = SectionOption(
-                    section_type="Lab",
-                    section_id=section_id,
-                    days_of_week=days_of_week,
-                    start_time=start_time,
-                    end_time=end_time,
-                    location=None
-                )
-                sections.append(section)
-            except (ValueError, IndexError):
+                # Determine AM/PM (simplified - may need refinement)
+                start_time = time(int(start_hour) % 24, int(start_min))
+                end_time = time(int(end_hour) % 24, int(end_min))
+            except ValueError:
+                # Skip matches that don't parse correctly
                 continue
+            
+            sections.append(SectionOption(
+                section_type=section_type.capitalize(),
+                section_id=section_id,
+                days_of_week=days_of_week,
+                start_time=start_time,
+                end_time=end_time,
+                location=None  # Extract location if pattern found
+            ))
         
         return sections
     
@@ -509,8 +1441,6 @@ class PDFExtractor:
             List of AssessmentTask objects with extracted information
         """
         assessments = []
-        # Search entire PDF for assessments
-        full_text = "\n".join([text for _, text in self.pages_text])
         
         # First, try structured table extraction using pdfplumber (most reliable for table-based PDFs)
         structured_assessments = self._extract_assessments_from_table_structured()
@@ -522,6 +1452,10 @@ class PDFExtractor:
                 # If we found valid assessments in structured table, return early (avoid duplicates)
                 return assessments
         
+        # Search entire PDF for assessments. Only joined once structured tables came up
+        # empty; the legacy due-date scan below streams page by page instead
+        full_text = self._joined_text()
+        
         # Fallback to text-based table extraction
         table_assessments = self._extract_assessments_from_table(full_text)
         if table_assessments:
@@ -540,84 +1474,11 @@ class PDFExtractor:
         
         if use_pattern_matching:
             # Fallback to pattern matching if table extraction didn't work
-            # Pattern for assessments with due dates
-            assessment_patterns = [
-                r'(Assignment|ASSIGNMENT|HW|Homework)\s+(\d+)[^\n]*(?:due|Due|DUE)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})',
-                r'(Quiz|QUIZ|Test)\s+(\d+)[^\n]*(?:due|Due|DUE|on|On)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})',
-                r'(Lab\s+Report|Laboratory\s+Report|Lab\s+Assignment)\s+(\d+)[^\n]*(?:due|Due|DUE)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})',
-                r'(Final\s+Exam|FINAL|Final\s+Examination)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})',
-                r'(Midterm|MIDTERM|Mid-term)[^\n]*?(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\w+\s+\d{1,2},?\s+\d{4})',
-            ]
-            
-            for pattern in assessment_patterns:
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
-                for match in matches:
-                    groups = match.groups()
-                    # Determine assessment type and title
-                    if 'Quiz' in match.group(0):
-                        assessment_type = 'quiz'
-                        # Extract quiz number if available
-                        quiz_num = groups[1] if len(groups) > 1 and groups[1].isdigit() else (groups[2] if len(groups) > 2 and groups[2].isdigit() else '')
-                        title = f"Quiz {quiz_num}" if quiz_num else "Quiz"
-                    elif 'Midterm' in match.group(0):
-                        assessment_type = 'midterm'
-                        title = "Midterm Exam"
-                    elif 'Final' in match.group(0):
-                        assessment_type = 'final'
-                        title = "Final Exam"
-                    elif 'Assignment' in match.group(0) or 'HW' in match.group(0):
-                        assessment_type = 'assignment'
-                        title = match.group(0)[:50]
-                    else:
-                        assessment_type = 'other'
-                        title = match.group(0)[:50]
-                    
-                    # Try to extract due date - look for month and day in the match
-                    due_date_str = None
-                    # Check last groups for date info
-                    for i in range(len(groups) - 1, -1, -1):
-                        if groups[i] and (groups[i].isdigit() or any(month in groups[i] for month in ['Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep'])):
-                            # Try to construct date string
-                            if i > 0 and groups[i-1]:
-                                # Month name and day
-                                due_date_str = f"{groups[i-1]} {groups[i]}, 2025"
-                            elif groups[i].isdigit() and i > 0:
-                                # Look for month before this group
-                                context = match.group(0)[:match.start() + match.end()]
-                                month_match = re.search(r'(Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)', context, re.IGNORECASE)
-                                if month_match:
-                                    due_date_str = f"{month_match.group(0)} {groups[i]}, 2025"
-                            break
-                    
-                    due_datetime = None
-                    if due_date_str:
-                        parsed_date = dateparser.parse(due_date_str)
-                        if parsed_date:
-                            # Default to 11:59 PM if no time specified
-                            due_datetime = datetime.combine(
-                                parsed_date.date(),
-                                time(23, 59)
-                            )
-                    
-                    # Try to extract weight from surrounding text
-                    weight = self._extract_weight(match.group(0))
-                    
-                    assessment = AssessmentTask(
-                        title=self._clean_assessment_title(title),
-                        type=assessment_type,
-                        weight_percent=weight,
-                        due_datetime=due_datetime,
-                        confidence=0.7 if due_datetime else 0.4,
-                        source_evidence=f"Found: {match.group(0)[:100]}",
-                        needs_review=(due_datetime is None or weight is None)
-                    )
-                    assessments.append(assessment)
+            assessments.extend(self._extract_assessments_with_due_dates())
         
         # Also search for relative rules
-            relative_rules = self._extract_relative_rules(full_text)
-            for rule_text, anchor in relative_rules:
-                # Create assessment with rule
-                assessment = AssessmentTask(
+            assessments.extend(
+                AssessmentTask(
                     title=f"Assessment (rule: {rule_text[:30]})",
                     type="other",
                     due_rule=rule_text,
@@ -626,77 +1487,118 @@ class PDFExtractor:
                     source_evidence=f"Relative rule: {rule_text}",
                     needs_review=True
                 )
-                assessments.append(assessment)
-        
-        # Filter out unwanted assessments (e.g., those starting with "#" or other patterns)
-        filtered_assessments = []
-        excluded_patterns = [
-            r'^#',  # Assessments starting with #
-            r'^completion#?$',  # Just "Completion" or "Completion#"
-            r'^#completion',  # "#Completion"
-        ]
+                for rule_text, anchor in self._extract_relative_rules(full_text)
+            )
         
+        # Filter out unwanted assessments and deduplicate in one pass.
+        # Deduplicate: Remove assessments with same title but no date/weight if we have a better version,
+        # keyed by normalized title; dicts keep insertion order, so re-inserting a
+        # replacement moves it to the end just like removing and appending it to a list
+        seen_titles = {}
         for assessment in assessments:
-            should_exclude = False
             title_lower = assessment.title.lower().strip()
+            # Exclude titles starting with "#" etc., or just "#"/very short with special characters
+            if _EXCLUDED_TITLE_RE.match(title_lower) or (len(title_lower) <= 2 and '#' in title_lower):
+                continue
             
-            # Check against exclusion patterns
-            for pattern in excluded_patterns:
-                if re.match(pattern, title_lower, re.IGNORECASE):
-                    should_exclude = True
-                    break
+            title_normalized = _normalize_title_key(assessment.title)
+            existing = seen_titles.get(title_normalized)
+            if existing is None:
+                seen_titles[title_normalized] = assessment
+            # Keep the one with date and weight, or higher confidence
+            elif ((assessment.due_datetime and assessment.weight_percent and
+                   (not existing.due_datetime or not existing.weight_percent))
+                  or assessment.confidence > existing.confidence):
+                del seen_titles[title_normalized]
+                seen_titles[title_normalized] = assessment
+            # Otherwise skip this duplicate
+        
+        return list(seen_titles.values())
+    
+    def _extract_assessments_with_due_dates(self) -> List[AssessmentTask]:
+        """Find assessments named next to a due date with the legacy patterns.
+        
+        Scans one page at a time with each pattern in turn, then handles matches
+        pattern by pattern (the order results were produced in when each pattern
+        scanned the whole text). Whole pages rather than lines: the [^\\n]* runs keep most of a match on
+        one line, but the \\s+ in names and dates may cross a wrap ("Lab\\nReport 2",
+        "December\\n15, 2025").
+        
+        Returns:
+            List of AssessmentTask objects, one per match
+        """
+        matches_by_kind = {kind: [] for kind, _ in _LEGACY_ASSESSMENT_PATTERNS}
+        for page_num, page_text in self._iter_pages_text():
+            # Skip pages that can't contain any of the patterns (cover pages, policies, ...)
+            if not _has_legacy_assessment_keyword(page_text.lower()):
+                continue
+            for kind, pattern in _LEGACY_ASSESSMENT_RES:
+                matches_by_kind[kind].extend((page_num, match) for match in pattern.finditer(page_text))
+        
+        return [
+            self._build_legacy_assessment(page_num, match)
+            for kind, _ in _LEGACY_ASSESSMENT_PATTERNS
+            for page_num, match in matches_by_kind[kind]
+        ]
+    
+    def _build_legacy_assessment(self, page_num: int, match) -> AssessmentTask:
+        """Build an AssessmentTask from one legacy due-date pattern match.
+        
+        Args:
+            page_num: Page the match was found on
+            match: Match of one of _LEGACY_ASSESSMENT_RES
             
-            # Also exclude if title is just "#" or very short with special characters
-            if len(title_lower) <= 2 and '#' in title_lower:
-                should_exclude = True
-            
-            if not should_exclude:
-                filtered_assessments.append(assessment)
-        
-        # Deduplicate: Remove assessments with same title but no date/weight if we have a better version
-        # Normalize titles for comparison (remove "In Class", case-insensitive, extract core name)
-        def normalize_title(title):
-            # Remove common prefixes and normalize
-            normalized = title.lower().strip()
-            normalized = re.sub(r'^in\s+class\s+', '', normalized)
-            normalized = re.sub(r'\s+', ' ', normalized)
-            # Extract core: "quiz 1", "midterm test 1", "final exam"
-            # Look for number anywhere after the type (not just immediately after)
-            match = re.search(r'^(quiz|midterm|final|assignment|lab\s+report).*?(\d+)', normalized)
-            if match:
-                type_name = match.group(1)
-                number = match.group(2)
-                normalized = f"{type_name} {number}"
-            else:
-                # No number found, just extract the type
-                normalized = re.sub(r'^(quiz|midterm|final|assignment|lab\s+report).*', r'\1', normalized).strip()
-            return normalized
+        Returns:
+            AssessmentTask with the title, type, due date and weight found in the match
+        """
+        groups = match.groups()
+        group_count = len(groups)
+        matched_text = match.group(0)
         
-        seen_titles = {}
-        deduplicated = []
-        for assessment in filtered_assessments:
-            title_normalized = normalize_title(assessment.title)
-            # Check if we already have a better version (with date and weight)
-            if title_normalized in seen_titles:
-                existing = seen_titles[title_normalized]
-                # Keep the one with date and weight, or higher confidence
-                if (assessment.due_datetime and assessment.weight_percent and 
-                    (not existing.due_datetime or not existing.weight_percent)):
-                    # Replace existing with better one
-                    deduplicated.remove(existing)
-                    deduplicated.append(assessment)
-                    seen_titles[title_normalized] = assessment
-                elif assessment.confidence > existing.confidence:
-                    # Replace with higher confidence
-                    deduplicated.remove(existing)
-                    deduplicated.append(assessment)
-                    seen_titles[title_normalized] = assessment
-                # Otherwise skip this duplicate
-            else:
-                seen_titles[title_normalized] = assessment
-                deduplicated.append(assessment)
+        # Determine assessment type and title
+        assessment_type = next(
+            (t for needle, t in _LEGACY_TYPE_RULES if needle in matched_text), 'other'
+        )
+        if assessment_type == 'quiz':
+            # Extract quiz number if available
+            quiz_num = groups[1] if group_count > 1 and groups[1].isdigit() else (groups[2] if group_count > 2 and groups[2].isdigit() else '')
+            title = f"Quiz {quiz_num}" if quiz_num else "Quiz"
+        else:
+            title = _LEGACY_TYPE_TITLES.get(assessment_type) or matched_text[:50]
+        
+        # Try to extract due date - look for month and day in the match
+        due_date = None
+        # Check last groups for date info
+        for i in range(group_count - 1, -1, -1):
+            group = groups[i]
+            if group and (group.isdigit() or _LEGACY_DATE_MONTH_RE.search(group)):
+                # Month name and day (dateparser only for unrecognised month names)
+                if i > 0 and groups[i-1]:
+                    due_date = _date_from_parts(groups[i-1], group, 2025)
+                elif group.isdigit() and i > 0:
+                    # Look for month before this group
+                    month_match = _MONTH_NAME_RE.search(matched_text)
+                    if month_match:
+                        due_date = _date_from_parts(month_match.group(0), group, 2025)
+                break
         
-        return deduplicated
+        due_datetime = None
+        if due_date:
+            # Default to 11:59 PM if no time specified
+            due_datetime = datetime.combine(due_date, time(23, 59))
+        
+        # Try to extract weight from surrounding text
+        weight = self._extract_weight(matched_text)
+        
+        return AssessmentTask(
+            title=self._clean_assessment_title(title),
+            type=assessment_type,
+            weight_percent=weight,
+            due_datetime=due_datetime,
+            confidence=0.7 if due_datetime else 0.4,
+            source_evidence=f"Page {page_num}: {matched_text[:100]}",
+            needs_review=(due_datetime is None or weight is None)
+        )
     
     def extract_course_info(self) -> Tuple[Optional[str], Optional[str]]:
         """Extract course code and name from the PDF.
@@ -704,14 +1606,13 @@ class PDFExtractor:
         Returns:
             Tuple of (course_code, course_name). Both can be None if not found.
         """
-        first_page = self.pages_text[0][1] if self.pages_text else ""
+        first_page = next((text for _, text in self._iter_pages_text(1)), "")
         
         course_code = None
         course_name = None
         
         # Extract course code - simple pattern matching
-        code_pattern = r'([A-Z]{2,4})\s+(\d{3,4}[A-Z]?)'
-        match = re.search(code_pattern, first_page)
+        match = _COURSE_CODE_RE.search(first_page)
         if match:
             dept = match.group(1)
             number = match.group(2)
@@ -719,62 +1620,68 @@ class PDFExtractor:
         
         # For course name, look at first few lines
         # Course name is usually on the first page, often on line 1 or near the course code
-        lines = first_page.split('\n')[:10]
-        for i, line in enumerate(lines):
+        lines = first_page.split('\n', 10)[:10]
+        for line in lines:
             line = line.strip()
             if len(line) < 5 or len(line) > 100:
                 continue
             
             # Skip lines that are obviously not course names
-            skip_patterns = ['university', 'www.', 'http', '@', 'email', 'phone', 'office', 
-                           'instructor', 'department of', 'course outline', 'syllabus', 'winter', 
-                           'fall', 'spring', 'summer', 'semester', r'20\d{2}']
-            if any(re.search(pattern, line, re.IGNORECASE) for pattern in skip_patterns):
+            if _COURSE_NAME_SKIP_RE.search(line):
                 continue
             
             # If line contains only letters, spaces, &, and is a reasonable length, it's likely the course name
-            if re.match(r'^[A-Za-z\s&\-]+$', line) and len(line) > 8:
+            # (length first - the regex is only worth running on lines long enough to count)
+            if len(line) > 8 and _COURSE_NAME_RE.match(line):
                 course_name = line
                 break
         
         return course_code, course_name
     
-    def _extract_schedule_from_tables(self, section_type: str) -> List[SectionOption]:
-        """Extract schedule from structured tables.
+    def _extract_schedule_from_tables(self) -> Dict[str, List[SectionOption]]:
+        """Extract lecture and lab schedules from structured tables in one pass.
         
-        Args:
-            section_type: "lecture" or "lab"
-            
         Returns:
-            List of SectionOption objects
+            Dict mapping "lecture" and "lab" to lists of SectionOption objects
         """
-        sections = []
-        keywords = ["lecture", "lec", "class"] if section_type == "lecture" else ["lab", "laboratory", "tutorial", "tut"]
+        sections = {section_type: [] for section_type in _has_schedule_table_keyword}
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages[:MAX_PAGES_TO_SEARCH], 1):
-                tables = page.extract_tables()
-                for table in tables:
-                    if not table or len(table) < 2:
+        for index in range(min(self._num_pages, MAX_PAGES_TO_SEARCH)):
+            # Table cells hold the page's own text, so a page whose text has no schedule
+            # keyword can't have a schedule row - skip pdfplumber's table detection there
+            page_text = self._page_text(index)
+            if not page_text:
+                continue
+            page_text_lower = page_text.lower()
+            if not any(has_keyword(page_text_lower) for has_keyword in _has_schedule_table_keyword.values()):
+                continue
+            
+            for table in self._page_tables(index):
+                if not table or len(table) < 2:
+                    continue
+                
+                # Check each row for schedule info
+                for row in table:
+                    row_text = ' '.join([str(c).lower() if c else '' for c in row])
+                    
+                    # Check which section types the row mentions
+                    section_types = [
+                        section_type for section_type, has_keyword in _has_schedule_table_keyword.items()
+                        if has_keyword(row_text)
+                    ]
+                    if not section_types:
                         continue
                     
-                    # Check each row for schedule info
-                    for row in table:
-                        row_text = ' '.join([str(c).lower() if c else '' for c in row])
-                        
-                        # Check if row contains our section type
-                        if not any(kw in row_text for kw in keywords):
+                    # Look for time pattern in the row
+                    for cell in row:
+                        if not cell:
                             continue
-                        
-                        # Look for time pattern in the row
-                        for cell in row:
-                            if not cell:
-                                continue
-                            cell_text = str(cell)
-                            parsed = self._parse_time_and_days_from_text(cell_text)
-                            if parsed:
-                                days, start_t, end_t = parsed
-                                sections.append(SectionOption(
+                        cell_text = str(cell)
+                        parsed = self._parse_time_and_days_from_text(cell_text)
+                        if parsed:
+                            days, start_t, end_t = parsed
+                            for section_type in section_types:
+                                sections[section_type].append(SectionOption(
                                     section_type=section_type.capitalize(),
                                     section_id="",
                                     days_of_week=days,
@@ -785,61 +1692,54 @@ class PDFExtractor:
         
         return sections
     
-    def _extract_schedule_from_text(self, section_type: str, search_text: str) -> List[SectionOption]:
-        """Extract schedule from text patterns.
+    def _extract_schedule_from_text(self, search_text: str) -> Dict[str, List[SectionOption]]:
+        """Extract lecture and lab schedules from text patterns.
+        
+        The shared day/time patterns are run once and their matches used for
+        both section types, followed by each type's keyword pattern. Patterns
+        whose required literals don't occur in the text are skipped.
         
         Args:
-            section_type: "lecture" or "lab"
             search_text: Text to search in
             
         Returns:
-            List of SectionOption objects
+            Dict mapping "lecture" and "lab" to lists of SectionOption objects
         """
-        sections = []
-        
-        # Comprehensive patterns for schedule extraction
-        patterns = [
-            # "Mondays, 1:30 – 4:30 pm in SSC 3018"
-            r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)s?[,\s]+(\d{1,2})[:.:](\d{2})\s*[-–]\s*(\d{1,2})[:.:](\d{2})\s*([ap]\.?m\.?)?(?:\s+in\s+([A-Z0-9\s]+))?',
-            # "Lecture: Friday 1.30 pm-2.30 pm"
-            r'(?:Lecture|Lab|Tutorial)[:\s]+([A-Za-z]+(?:day)?)\s+(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?',
-            # "Section 001: Tuesday, 1:30pm-4:30pm"
-            r'Section\s*\d*[:\s]+([A-Za-z]+(?:day)?)[,\s]+(\d{1,2})[:.:](\d{2})\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2})[:.:](\d{2})\s*([ap]\.?m\.?)?',
-        ]
-        
-        # Filter patterns by section type
-        if section_type == "lecture":
-            keyword_pattern = r'(?:lecture|lec|class)[\s:]+.*?(\d{1,2})[:.:](\d{2})\s*[-–]\s*(\d{1,2})[:.:](\d{2})'
-        else:
-            keyword_pattern = r'(?:lab|laboratory|tutorial)[\s:]+.*?(\d{1,2})[:.:](\d{2})\s*[-–]\s*(\d{1,2})[:.:](\d{2})'
-        
-        patterns.append(keyword_pattern)
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, search_text, re.IGNORECASE):
-                full_match = match.group(0)
-                parsed = self._parse_time_and_days_from_text(full_match)
+        search_lower = search_text.lower()
+        shared = []
+        for literals, pattern in _SCHEDULE_TEXT_PATTERNS:
+            if not any(literal in search_lower for literal in literals):
+                continue
+            for match in pattern.finditer(search_text):
+                parsed = self._parse_time_and_days_from_text(match.group(0))
                 if parsed:
-                    days, start_t, end_t = parsed
-                    sections.append(SectionOption(
+                    shared.append(parsed)
+        
+        sections = {}
+        for section_type, (literals, keyword_pattern) in _SCHEDULE_KEYWORD_PATTERNS.items():
+            found = list(shared)
+            if any(literal in search_lower for literal in literals):
+                for match in keyword_pattern.finditer(search_text):
+                    parsed = self._parse_time_and_days_from_text(match.group(0))
+                    if parsed:
+                        found.append(parsed)
+            
+            # Deduplicate (first occurrence wins; dicts keep insertion order)
+            unique = {}
+            for days, start_t, end_t in found:
+                key = _schedule_key(days, start_t, end_t)
+                if key not in unique:
+                    unique[key] = SectionOption(
                         section_type=section_type.capitalize(),
                         section_id="",
                         days_of_week=days,
                         start_time=start_t,
                         end_time=end_t,
                         location=None
-                    ))
-        
-        # Deduplicate
-        seen = set()
-        unique = []
-        for s in sections:
-            key = (tuple(s.days_of_week), s.start_time, s.end_time)
-            if key not in seen:
-                seen.add(key)
-                unique.append(s)
+                    )
+            sections[section_type] = list(unique.values())
         
-        return unique
+        return sections
     
     def _parse_time_and_days_from_text(self, text: str) -> Optional[Tuple[List[int], time, time]]:
         """Parse time and days from text.
@@ -850,34 +1750,22 @@ class PDFExtractor:
         Returns:
             Tuple of (days_list, start_time, end_time) or None
         """
-        # Extract days
+        # Extract days - the first pattern that matches decides them
         days = []
-        day_patterns = [
-            (r'\b(Monday)s?\b', [0]),
-            (r'\b(Tuesday)s?\b', [1]),
-            (r'\b(Wednesday)s?\b', [2]),
-            (r'\b(Thursday)s?\b', [3]),
-            (r'\b(Friday)s?\b', [4]),
-            (r'\b(Saturday)s?\b', [5]),
-            (r'\b(Sunday)s?\b', [6]),
-            (r'\b([MTWRF]{1,5})\b', None),  # MWF, TTh, etc.
-        ]
-        
-        for pattern, fixed_days in day_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, fixed_days in _SCHEDULE_DAY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 if fixed_days:
                     days = fixed_days
                 else:
                     days = self._parse_days_of_week(match.group(1))
-                    break
+                break
         
         if not days:
             return None
         
         # Extract time
-        time_pattern = r'(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?\s*[-–]\s*(\d{1,2})[\.:](\d{2})\s*([ap]\.?m\.?)?'
-        match = re.search(time_pattern, text, re.IGNORECASE)
+        match = _SCHEDULE_TIME_RE.search(text)
         if not match:
             return None
         
@@ -915,24 +1803,11 @@ class PDFExtractor:
         Returns:
             List of AssessmentTask objects
         """
-        assessments = []
+        # Assessments keyed by lowercased title (first occurrence wins; dicts keep insertion order)
+        unique: Dict[str, AssessmentTask] = {}
         
         # Find assessment/evaluation section
-        section_patterns = [
-            r'(?:Methods\s+of\s+)?Evaluation\b',
-            r'Assessment\s+(?:and\s+)?Evaluation',
-            r'Grading\s+Scheme',
-            r'Grade\s+Breakdown',
-            r'Mark\s+Breakdown',
-            r'Course\s+Evaluation',
-        ]
-        
-        section_start = -1
-        for pattern in section_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                section_start = match.start()
-                break
+        section_start = _find_text_evaluation_section(text)
         
         if section_start == -1:
             return []
@@ -941,27 +1816,32 @@ class PDFExtractor:
         section_text = text[section_start:section_start + 5000]
         lines = section_text.split('\n')
         
-        # Assessment keywords
-        assessment_keywords = [
-            'quiz', 'midterm', 'final', 'exam', 'test', 'assignment', 'project',
-            'lab', 'report', 'essay', 'presentation', 'participation', 'homework',
-            'peerwise', 'pcb', 'bonus'
-        ]
-        
         # Look for lines with percentages or standalone numbers (in % of total grade context)
         for line in lines[:60]:
-            if len(line.strip()) < 5 or len(line.strip()) > 200:
+            # Strip and lowercase each line once; the checks below reuse these
+            line_stripped = line.strip()
+            if len(line_stripped) < 5 or len(line_stripped) > 200:
+                continue
+            
+            # A weight is either "N%" or a number ending the line; skip lines that can't have one
+            has_percent = '%' in line
+            if not has_percent and not line_stripped[-1].isdigit():
+                continue
+            
+            # Check if line contains assessment keywords (cheap prefilter before the weight regexes)
+            line_lower = line.lower()
+            if not _has_text_assessment_keyword(line_lower):
                 continue
             
             # Check for percentage pattern (with or without % sign)
-            weight_match = re.search(r'(\d+(?:\.\d+)?)\s*%', line)
+            weight_match = _PERCENT_WEIGHT_RE.search(line) if has_percent else None
             weight = None
             
             if weight_match:
                 weight = float(weight_match.group(1))
             else:
                 # Look for standalone numbers at end of line (common in grade tables)
-                number_match = re.search(r'\s(\d{1,2}(?:\.\d+)?)\s*$', line.strip())
+                number_match = _TRAILING_NUMBER_WEIGHT_RE.search(line_stripped)
                 if number_match:
                     potential_weight = float(number_match.group(1))
                     if 5 <= potential_weight <= 60:  # Reasonable weight range
@@ -975,19 +1855,18 @@ class PDFExtractor:
             if weight > 60:
                 continue
             
-            # Check if line contains assessment keywords
-            line_lower = line.lower()
-            if not any(kw in line_lower for kw in assessment_keywords):
-                continue
-            
             # Extract assessment name
             if weight_match:
                 name_text = line[:weight_match.start()].strip()
             else:
-                name_text = line.strip()
-            name_text = re.sub(r'^[\s\-•·]+', '', name_text)
-            name_text = re.sub(r'\([^)]*\)$', '', name_text).strip()
-            name_text = re.sub(r'\s+\d+$', '', name_text).strip()  # Remove trailing number
+                name_text = line_stripped
+            # name_text is already stripped, so each cleanup only runs when its end character can match
+            if name_text.startswith(('-', '•', '·')):
+                name_text = _LEADING_BULLET_RE.sub('', name_text)
+            if name_text.endswith(')'):
+                name_text = _TRAILING_PARENTHETICAL_RE.sub('', name_text)
+            if name_text[-1:].isdigit():
+                name_text = _TRAILING_NUMBER_RE.sub('', name_text)  # Remove trailing number
             
             # CRITICAL FILTERS for false positives
             # Skip if name is too short or too long
@@ -995,25 +1874,8 @@ class PDFExtractor:
                 continue
             
             # Skip policy/requirement text patterns
-            policy_patterns = [
-                r'^to be eligible',
-                r'^to obtain',
-                r'^at least (a|an|\d)',
-                r'^you must',
-                r'^students must',
-                r'^a (minimum|final|passing|grade)',
-                r'^the (minimum|final|passing)',
-                r'^will be reweighted',
-                r'^there (is|are|will)',
-                r'^each is worth',
-                r'result in',
-                r'weighted average',
-                r'^obtain a',
-                r'^achieve',
-                r'a mark of',
-                r'a grade of',
-            ]
-            if any(re.match(pattern, name_text.lower()) for pattern in policy_patterns):
+            name_lower = name_text.lower()
+            if _POLICY_TEXT_RE.match(name_lower):
                 continue
             
             # Skip if it looks like a sentence fragment (starts with lowercase)
@@ -1021,8 +1883,13 @@ class PDFExtractor:
                 continue
             
             # Skip if it contains verbs that indicate it's not an assessment title
-            sentence_indicators = ['is', 'are', 'will be', 'must', 'should', 'may', 'can']
-            if any(f' {word} ' in name_text.lower() for word in sentence_indicators):
+            if _SENTENCE_VERB_RE.search(name_lower):
+                continue
+            
+            # Skip repeats of a title already found before parsing dates or building the task
+            title = self._clean_assessment_title(name_text[:80])
+            title_key = title.lower().strip()
+            if title_key in unique:
                 continue
             
             # Determine assessment type
@@ -1040,8 +1907,8 @@ class PDFExtractor:
             # Try to extract due date
             due_datetime = self._parse_date_from_text(line)
             
-            assessment = AssessmentTask(
-                title=self._clean_assessment_title(name_text[:80]),
+            unique[title_key] = AssessmentTask(
+                title=title,
                 type=atype,
                 weight_percent=weight,
                 due_datetime=due_datetime,
@@ -1049,18 +1916,8 @@ class PDFExtractor:
                 confidence=0.7,
                 source_evidence=f"Text: {line[:50]}..."
             )
-            assessments.append(assessment)
-        
-        # Deduplicate
-        seen = set()
-        unique = []
-        for a in assessments:
-            key = a.title.lower().strip()
-            if key not in seen:
-                seen.add(key)
-                unique.append(a)
         
-        return unique
+        return list(unique.values())
     
     def _parse_days_of_week(self, days_str: str) -> List[int]:
         """Parse day abbreviations from text like "MWF" or "TTh".
@@ -1076,52 +1933,8 @@ class PDFExtractor:
             List of weekday numbers (0=Monday, 6=Sunday), sorted and with duplicates removed.
             Example: "MWF" returns [0, 2, 4]
         """
-        # Map of day abbreviations to weekday numbers
-        # Python uses 0=Monday, 1=Tuesday, etc.
-        day_map = {
-            'M': 0, 'Mon': 0, 'Monday': 0,
-            'T': 1, 'Tue': 1, 'Tuesday': 1,
-            'W': 2, 'Wed': 2, 'Wednesday': 2,
-            'Th': 3, 'Thu': 3, 'Thursday': 3,
-            'F': 4, 'Fri': 4, 'Friday': 4,
-            'S': 5, 'Sat': 5, 'Saturday': 5,
-            'Su': 6, 'Sun': 6, 'Sunday': 6,
-        }
-        
-        days = []
-        days_str_upper = days_str.upper()  # Convert to uppercase for case-insensitive matching
-        
-        # Handle common patterns found in course outlines
-        # Check for Monday (M) - but make sure it's not part of "MT" or "MW"
-        if 'M' in days_str_upper and days_str_upper.index('M') < len(days_str_upper) - 1:
-            # Make sure the next character isn't 'T' (which would be part of "MT" or "MW")
-            if days_str_upper[days_str_upper.index('M') + 1] != 'T':
-                days.append(0)  # Monday
-        
-        # Check for Tuesday (T) or Thursday (TH)
-        if 'T' in days_str_upper:
-            idx = days_str_upper.index('T')
-            # If next character is 'H', it's Thursday
-            if idx + 1 < len(days_str_upper) and days_str_upper[idx + 1] == 'H':
-                days.append(3)  # Thursday
-            else:
-                days.append(1)  # Tuesday
-        
-        # Check for Wednesday (W)
-        if 'W' in days_str_upper:
-            days.append(2)  # Wednesday
-        
-        # Check for Thursday (TH or THU) - in case it wasn't caught above
-        if 'TH' in days_str_upper or 'THU' in days_str_upper:
-            days.append(3)  # Thursday
-        
-        # Check for Friday (F)
-        if 'F' in days_str_upper:
-            days.append(4)  # Friday
-        
-        # Remove duplicates and sort the list
-        # This ensures we return a clean, sorted list like [0, 2, 4] for "MWF"
-        return sorted(list(set(days)))
+        # Unpack the bitmask to a sorted list like [0, 2, 4] for "MWF"
+        return list(_DAY_MASK_DAYS[_days_mask(days_str)])
     
     def _extract_assessments_from_table(self, text: str) -> List[AssessmentTask]:
         """Extract assessments from the assessment table in the PDF.
@@ -1138,44 +1951,39 @@ class PDFExtractor:
         assessments = []
         
         # Find the assessment section - look for "Assessment and Evaluation" title
-        # Try multiple patterns to find the section
-        assessment_section_patterns = [
-            r'(?:8\.\s*)?Assessment\s+(?:and\s+)?Evaluation[^\n]*(?:\n[^\n]*){0,500}',  # More lines after title
-            r'Assessment\s+(?:and\s+)?Evaluation\s+Policy[^\n]*(?:\n[^\n]*){0,500}',
-            r'Assessment\s+(?:and\s+)?Evaluation[^\n]*(?:\n[^\n]*){0,1000}',  # Even more lines
-        ]
-        
         section_text = None
-        for pattern in assessment_section_patterns:
-            section_match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if section_match:
-                section_text = section_match.group(0)
-                # Find where the section ends (next major section or end of document)
-                # Look for next numbered section or major heading
-                next_section_match = re.search(r'\n(?:\d+\.\s+)?(?:Course|Instructor|Textbook|Schedule|Policies|Grading|Contact|Information|General|Appendix)', section_text, re.IGNORECASE)
-                if next_section_match:
-                    section_text = section_text[:next_section_match.start()]
-                break
+        section_match = _ASSESSMENT_SECTION_RE.search(text)
+        if section_match:
+            # Find where the section ends (next major section or end of document),
+            # searching the text in place rather than a copy of the matched section
+            section_start, section_end = section_match.span()
+            next_section_match = _NEXT_SECTION_RE.search(text, section_start, section_end)
+            if next_section_match:
+                section_end = next_section_match.start()
+            section_text = text[section_start:section_end]
         
         if not section_text:
             # Fallback: search for any mention of assessment table
-            assessment_mentions = re.finditer(r'Assessment[^\n]*(?:\n[^\n]*){0,200}', text, re.IGNORECASE)
+            assessment_mentions = _ASSESSMENT_MENTION_RE.finditer(text)
             for match in assessment_mentions:
-                if 'weight' in match.group(0).lower() or 'due' in match.group(0).lower():
-                    section_text = match.group(0)
+                # Each mention spans up to 200 lines; copy and lowercase it once
+                mention = match.group(0)
+                mention_low = mention.lower()
+                if 'weight' in mention_low or 'due' in mention_low:
+                    section_text = mention
                     break
         
         if not section_text:
             return assessments
         
         # Look for table header: "Assessment Format Weight Due Date Flexibility"
-        header_pattern = r'Assessment\s+(?:Format\s+)?(?:Weight|Weighting)\s+(?:Due\s+)?Date\s*(?:Flexibility)?'
-        header_match = re.search(header_pattern, section_text, re.IGNORECASE)
-        
-        if not header_match:
-            # Try alternative header patterns
-            header_pattern = r'Assessment\s+Format\s+Weight'
-            header_match = re.search(header_pattern, section_text, re.IGNORECASE)
+        # (or the shorter "Assessment Format Weight" if the full header is nowhere in the section)
+        header_match = _ASSESSMENT_TABLE_HEADER_RE.search(section_text)
+        if header_match and not header_match.group('full'):
+            full_header_match = _ASSESSMENT_TABLE_HEADER_RE.search(section_text, header_match.end())
+            while full_header_match and not full_header_match.group('full'):
+                full_header_match = _ASSESSMENT_TABLE_HEADER_RE.search(section_text, full_header_match.end())
+            header_match = full_header_match or header_match
         
         if not header_match:
             return assessments
@@ -1188,15 +1996,42 @@ class PDFExtractor:
         # Split table text into lines and process row by row
         # Look for assessment rows - each assessment typically starts with a name
         # Filter out empty/short lines to avoid index issues
-        all_lines = table_text.split('\n')
-        lines = [l.strip() for l in all_lines if l.strip() and len(l.strip()) >= 3]
+        # Strip each line once; a stripped line of 3+ chars is never empty
+        lines = [l for l in (raw.strip() for raw in table_text.split('\n')) if len(l) >= 3]
+        # Lowercase every line once up front; the loop below only reads these
+        lines_low = [l.lower() for l in lines]
+        
+        # Find candidate rows with one scan over the joined table text, mapping match
+        # offsets back to line indices. Only the first hit on each line is needed.
+        table_low = '\n'.join(lines_low)
+        line_starts = []
+        offset = 0
+        for candidate_low in lines_low:
+            line_starts.append(offset)
+            offset += len(candidate_low) + 1
+        candidate_lines = set()
+        candidate_match = _ASSESSMENT_CANDIDATE_RE.search(table_low)
+        while candidate_match:
+            line_idx = bisect_right(line_starts, candidate_match.start()) - 1
+            candidate_lines.add(line_idx)
+            if line_idx + 1 >= len(line_starts):
+                break
+            candidate_match = _ASSESSMENT_CANDIDATE_RE.search(table_low, line_starts[line_idx + 1])
         
         i = 0
         while i < len(lines):
+            if i not in candidate_lines:
+                i += 1
+                continue
+            
             line = lines[i]
+            # Match against the lowercased line so the detection patterns below don't need re.IGNORECASE.
+            # Whitespace runs are collapsed so fixed prefixes can be checked with startswith.
+            line_low = ' '.join(lines_low[i].split())
+            next_line_low = lines_low[i + 1] if i + 1 < len(lines) else ''
             
             # Stop processing if we hit the "Designated Assessment" section - this is informational, not an assessment
-            if re.match(r'^Designated\s+Assessment', line, re.IGNORECASE):
+            if line_low.startswith('designated assessment'):
                 break
             
             # Skip lines that are bullet points (informational sections, not assessments)
@@ -1207,59 +2042,31 @@ class PDFExtractor:
             # Check if this line starts an assessment - handle multi-line names
             assessment_name_match = None
             assessment_name = None
+            assessment_kind: Optional[str] = None  # Which branch matched, see _ROW_KIND_TYPES
+            row_lines = None
+            j = None
             
             # IMPORTANT: Check for Midterm Test FIRST, before other patterns
             # This ensures Midterm Tests are caught even if they appear in unexpected positions
             # Handle both "Midterm Test 1" (with number) and "Midterm Test" (without number)
             if 'Midterm' in line and 'Test' in line:
-                match = re.search(r'Midterm\s+(?:Test|TEST)\s+(\d+)', line, re.IGNORECASE)
-                if match:
-                    midterm_num = match.group(1)
-                    assessment_name = f"Midterm Test {midterm_num}"
-                    row_lines = [line]
-                    j = i + 1
-                else:
-                    # Try alternative pattern - maybe "Midterm" and number are separated
-                    # BUT: Exclude numbers in parentheses like "(2 hrs)" - those are durations, not test numbers
-                    # Look for "Midterm Test" followed by a number that's NOT in parentheses
-                    alt_match = re.search(r'Midterm\s+(?:Test|TEST)\s+(\d+)', line, re.IGNORECASE)
-                    if alt_match:
-                        # Check if this number is in parentheses (like "(2 hrs)")
-                        num_pos = alt_match.start(1)
-                        # Look backwards to see if there's an opening parenthesis before the number
-                        before_num = line[:num_pos]
-                        if '(' in before_num and ')' not in before_num[:before_num.rfind('(')+1]:
-                            # Number is in parentheses - this is a duration, not a test number
-                            # Treat as "Midterm Test" without number
-                            if re.search(r'Midterm\s+(?:Test|TEST)(?:\s|\(|,|$)', line, re.IGNORECASE):
-                                assessment_name = "Midterm Test"
-                                row_lines = [line]
-                                j = i + 1
-                            else:
-                                i += 1
-                                continue
-                        else:
-                            midterm_num = alt_match.group(1)
-                            assessment_name = f"Midterm Test {midterm_num}"
-                            row_lines = [line]
-                            j = i + 1
-                    else:
-                        # No number found - this is just "Midterm Test" (common case)
-                        # Check that it's actually "Midterm Test" and not just "Midterm" in another context
-                        if re.search(r'Midterm\s+(?:Test|TEST)(?:\s|\(|,|$)', line, re.IGNORECASE):
-                            assessment_name = "Midterm Test"
-                            row_lines = [line]
-                            j = i + 1
-                        else:
-                            i += 1
-                            continue
+                match = _MIDTERM_TEST_RE.match(line_low)
+                if not match:
+                    i += 1
+                    continue
+                midterm_num = match.group(1)
+                assessment_name = f"Midterm Test {midterm_num}" if midterm_num else "Midterm Test"
+                assessment_kind = 'midterm'
+                row_lines = [line]
+                j = i + 1
             
             # First, check if this line starts with "PeerWise" - collect more lines for dates
-            elif re.match(r'^PeerWise', line, re.IGNORECASE):
+            elif line_low.startswith('peerwise'):
+                assessment_kind = 'peerwise'
                 # Look ahead to next line for "Assignment X"
                 if i + 1 < len(lines):
                     next_line = lines[i + 1]  # Already stripped in filtered lines
-                    assign_match = re.search(r'Assignment\s+(\d+)', next_line, re.IGNORECASE)
+                    assign_match = _ASSIGNMENT_NUM_RE.search(next_line_low)
                     if assign_match:
                         assessment_name = f"PeerWise Assignment {assign_match.group(1)}"
                         # Include next line in row_lines
@@ -1278,31 +2085,35 @@ class PDFExtractor:
                 
                 # For PeerWise, collect more lines to capture all date information
                 # PeerWise dates are often split across multiple lines
-                while j < len(lines) and j < i + 8:  # Collect up to 8 more lines for PeerWise
-                    next_line = lines[j]
+                # Keep a running lowercased join instead of re-joining row_lines on every pass
+                joined_low = ' '.join(row_lines).lower()
+                window_end = i + 8  # Collect up to 8 more lines for PeerWise
+                for next_line, next_line_low in zip(lines[j:window_end], lines_low[j:window_end]):
                     # Stop if we hit another assessment
-                    if re.match(r'^(?:Midterm|Final|Assignment\s+\d+|PeerWise|Optional|Designated)', next_line, re.IGNORECASE):
+                    if _PEERWISE_NEXT_ASSESSMENT_RE.match(next_line_low):
                         break
                     # Stop if we've collected enough date information (both Author and Answer dates)
-                    if 'by 11:59 PM' in ' '.join(row_lines).lower() and 'feedback' in ' '.join(row_lines).lower():
+                    if 'by 11:59 pm' in joined_low and 'feedback' in joined_low:
                         # Check if we have both dates
-                        if re.search(r'Author.*?(\w+\.?\s+\w+\.?\s+\d+)', ' '.join(row_lines), re.IGNORECASE) and \
-                           re.search(r'feedback.*?(\w+\.?\s+\w+\.?\s+\d+)', ' '.join(row_lines), re.IGNORECASE):
+                        if _PEERWISE_AUTHOR_SEEN_RE.search(joined_low) and \
+                           _PEERWISE_FEEDBACK_SEEN_RE.search(joined_low):
                             break
                     row_lines.append(next_line)
+                    joined_low += ' ' + next_line_low
                     j += 1
             
             # Check for "Assignment X Slide redesign" - might be split
             # BUT: Skip if this is part of a PeerWise description (already handled above)
-            elif re.match(r'^Assignment\s+(\d+)', line, re.IGNORECASE) and not any('peerwise' in prev_line.lower() for prev_line in lines[max(0, i-2):i]):
-                assign_num_match = re.match(r'^Assignment\s+(\d+)', line, re.IGNORECASE)
+            elif _ASSIGNMENT_START_RE.match(line_low) and not any('peerwise' in prev_line_low for prev_line_low in lines_low[max(0, i-2):i]):
+                assign_num_match = _ASSIGNMENT_START_RE.match(line_low)
+                assessment_kind = 'assignment'
                 assign_num = assign_num_match.group(1) if assign_num_match else None
                 
                 # Check if next line has "Slide redesign"
                 if i + 1 < len(lines):
                     next_line = lines[i + 1]  # Already stripped
-                    if 'slide redesign' in next_line.lower():
-                        if 'teach' in next_line.lower():
+                    if 'slide redesign' in next_line_low:
+                        if 'teach' in next_line_low:
                             assessment_name = f"Assignment {assign_num} Slide redesign & Teach"
                         else:
                             assessment_name = f"Assignment {assign_num} Slide redesign"
@@ -1319,61 +2130,26 @@ class PDFExtractor:
                     row_lines = [line]
                     j = i + 1
             
-            # Check for other patterns - Midterm Test (can appear anywhere in line, not just start)
-            # Make this check more robust - check if line contains "Midterm Test" followed by a number
-            elif 'Midterm' in line and 'Test' in line:
-                match = re.search(r'Midterm\s+(?:Test|TEST)\s+(\d+)', line, re.IGNORECASE)
-                if match:
-                    midterm_num = match.group(1)
-                    assessment_name = f"Midterm Test {midterm_num}"
-                    row_lines = [line]
-                    j = i + 1
-                else:
-                    # Try alternative pattern - maybe "Midterm" and number are separated
-                    # BUT: Exclude numbers in parentheses like "(2 hrs)" - those are durations, not test numbers
-                    # Look for "Midterm Test" followed by a number that's NOT in parentheses
-                    alt_match = re.search(r'Midterm\s+(?:Test|TEST)\s+(\d+)', line, re.IGNORECASE)
-                    if alt_match:
-                        midterm_num = alt_match.group(1)
-                        assessment_name = f"Midterm Test {midterm_num}"
-                        row_lines = [line]
-                        j = i + 1
-                    else:
-                        # Check if there's a number after "Midterm Test" but not in parentheses
-                        # Pattern: "Midterm Test" followed by optional whitespace, then a number NOT preceded by "("
-                        alt_match2 = re.search(r'Midterm\s+(?:Test|TEST)(?:\s+)(\d+)(?!\s*hrs?|hours?)', line, re.IGNORECASE)
-                        if alt_match2 and not re.search(r'Midterm\s+(?:Test|TEST)\s*\(', line, re.IGNORECASE):
-                            midterm_num = alt_match2.group(1)
-                            assessment_name = f"Midterm Test {midterm_num}"
-                            row_lines = [line]
-                            j = i + 1
-                        else:
-                            # No number found - this is just "Midterm Test" (common case)
-                            # Check that it's actually "Midterm Test" and not just "Midterm" in another context
-                            if re.search(r'Midterm\s+(?:Test|TEST)(?:\s|\(|,|$)', line, re.IGNORECASE):
-                                assessment_name = "Midterm Test"
-                                row_lines = [line]
-                                j = i + 1
-                            else:
-                                i += 1
-                                continue
-            
-            elif re.match(r'^Final\s+(?:Exam|EXAM)', line, re.IGNORECASE):
+            elif line_low.startswith('final exam'):
                 assessment_name = "Final Exam"
+                assessment_kind = 'final'
                 row_lines = [line]
                 j = i + 1
             
-            elif re.match(r'^(?:Optional\s+)?(?:Bonus|BONUS)', line, re.IGNORECASE):
+            elif line_low.startswith(('bonus', 'optional bonus')):
                 assessment_name = "Optional Bonus Assignment"
+                assessment_kind = 'bonus'
                 row_lines = [line]
                 j = i + 1
             
             # Fallback to general pattern
             else:
-                general_match = re.search(r'((?:In\s+Class\s+)?(?:Quiz|QUIZ)\s+\d+|(?:Midterm|MIDTERM|Mid-term)\s+(?:Test|Exam)?\s*\d*|(?:Final\s+)?(?:Exam|EXAM|Examination)|(?:Assignment|ASSIGNMENT)\s+\d+|(?:PeerWise|Peerwise)\s+(?:Assignment|ASSIGNMENT)\s+\d+|(?:Lab\s+)?(?:Report|REPORT)|(?:Slide\s+)?(?:redesign|Redesign)(?:\s+&\s+Teach)?|(?:Participation|Participation\s+Grade)|(?:Project|PROJECT)|(?:Presentation|PRESENTATION)|(?:Paper|PAPER)|(?:Essay|ESSAY)|(?:Reflection|REFLECTION)|(?:Optional\s+)?(?:Bonus|BONUS)\s+(?:Assignment|ASSIGNMENT)?)', line, re.IGNORECASE)
+                general_match = _GENERAL_ASSESSMENT_RE.search(line)
                 if general_match:
                     assessment_name_match = general_match
                     assessment_name = general_match.group(1)
+                    # The general pattern can also pick up "PeerWise Assignment N"
+                    assessment_kind = 'peerwise' if 'peerwise' in assessment_name.lower() else 'other'
                     row_lines = [line]
                     j = i + 1
                 else:
@@ -1382,34 +2158,18 @@ class PDFExtractor:
             
             if assessment_name:
                 # Found an assessment - collect continuation lines (if not already done above)
-                if 'row_lines' not in locals() or 'j' not in locals():
+                if row_lines is None or j is None:
                     row_lines = [line]
                     j = i + 1
                 
                 # Collect continuation lines (up to 10 more lines to capture multi-line entries)
-                while j < len(lines) and j < i + 11:
-                    next_line = lines[j]  # Already stripped in filtered array
+                window_end = i + 11
+                for next_line, next_line_low in zip(lines[j:window_end], lines_low[j:window_end]):
+                    # Lines are already stripped in the filtered array
                     # Stop if we hit another assessment or section header
                     # Be more specific: only stop if it's clearly a new assessment (not part of description)
                     # Check for assessment names at start of line, or section headers
-                    stop_patterns = [
-                        r'^(?:In\s+Class\s+)?(?:Quiz|QUIZ)\s+\d+',  # Quiz 1, Quiz 2, etc.
-                        r'^Midterm\s+(?:Test|TEST)(?:\s+\d+)?',  # Midterm Test 1, Midterm Test 2, or just Midterm Test
-                        r'^(?:Final\s+)?(?:Exam|EXAM)',  # Final Exam
-                        r'^PeerWise',  # New PeerWise assignment
-                        r'^Assignment\s+\d+\s+(?:Slide|Augment)',  # Assignment X Slide redesign (new assessment)
-                        r'^(?:Optional\s+)?(?:Bonus|BONUS)',  # Optional Bonus
-                        r'^Designated',  # Section header
-                        r'^Information',  # Section header
-                        r'^General',  # Section header
-                    ]
-                    should_stop = False
-                    for pattern in stop_patterns:
-                        if re.match(pattern, next_line, re.IGNORECASE):
-                            should_stop = True
-                            break
-                    
-                    if should_stop:
+                    if _ASSESSMENT_ROW_STOP_RE.match(next_line_low):
                         # Don't include this line in row_lines, but j now points to it
                         # This ensures the next iteration will process this line
                         # BUT: Make sure we don't skip the line - the while loop will increment i
@@ -1421,112 +2181,110 @@ class PDFExtractor:
                     j += 1
                 
                 row_text = ' '.join(row_lines)
+                row_text_low = row_text.lower()
+                is_peerwise = assessment_kind == 'peerwise'
                 
-                # Classify type
-                assessment_type = self._classify_assessment_type(assessment_name)
+                # Classify type - fixed-name rows already know their type
+                assessment_type = _ROW_KIND_TYPES.get(assessment_kind) or self._classify_assessment_type(assessment_name)
                 
                 # Extract weight
                 weight = self._extract_weight(row_text)
                 
                 # Extract due date(s)
                 due_dates = []
+                # Date strings are built from a known month/day/year, so their date values
+                # are computed directly instead of being re-parsed by dateparser
+                due_date_values: Dict[str, Optional[date]] = {}
                 # For PeerWise assignments, look for "Author:" and "Answer and provide feedback:" dates
-                if 'peerwise' in assessment_name.lower():
+                if is_peerwise:
                     # Pattern for PeerWise dates: "Author: Mon, Oct. 27th by 11:59 PM" and "feedback: Wed, Oct. 29th by 11:59 PM"
                     # Handle abbreviated day names (Mon, Tue, Wed, Thu, Fri, Sat, Sun) and abbreviated months (Oct., Jan., etc.)
-                    peerwise_patterns = [
-                        r'Author:?\s*(?:Mon|Monday|Tue|Tuesday|Wed|Wednesday|Thu|Thursday|Fri|Friday|Sat|Saturday|Sun|Sunday),?\s+(Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)\.?\s+(\d{1,2})(?:st|nd|rd|th)?',
-                        r'feedback:?\s*(?:Mon|Monday|Tue|Tuesday|Wed|Wednesday|Thu|Thursday|Fri|Friday|Sat|Saturday|Sun|Sunday),?\s+(Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)\.?\s+(\d{1,2})(?:st|nd|rd|th)?',
-                    ]
+                    # Author and feedback dates are found in one pass; author dates are kept first
+                    # so the feedback (answer) date stays last in due_dates
+                    author_dates = []
+                    feedback_dates = []
+                    for date_match in _PEERWISE_DATE_RE.finditer(row_text):
+                        month = date_match.group('month')
+                        day = date_match.group('day')
+                        
+                        # Determine year based on month
+                        year = _MONTH_TO_YEAR.get(month.lower(), 2025)
+                        
+                        date_str = f"{month} {day}, {year}"
+                        due_date_values[date_str] = _date_from_parts(month, day, year)
+                        if date_match.group('kind').lower() == 'author':
+                            author_dates.append(date_str)
+                        else:
+                            feedback_dates.append(date_str)
                     
-                    for pattern in peerwise_patterns:
-                        date_matches = re.finditer(pattern, row_text, re.IGNORECASE)
-                        for date_match in date_matches:
-                            if len(date_match.groups()) == 2:
-                                month = date_match.group(1)
-                                day = date_match.group(2)
-                                
-                                # Determine year based on month
-                                year = 2025
-                                if any(m in month.lower() for m in ['jan', 'feb', 'mar', 'apr']):
-                                    year = 2026
-                                elif month.lower() in ['october', 'oct', 'november', 'nov', 'december', 'dec']:
-                                    year = 2025
-                                
-                                date_str = f"{month} {day}, {year}"
-                                # Avoid duplicates
-                                if date_str not in due_dates:
-                                    due_dates.append(date_str)
+                    # Avoid duplicates (first occurrence wins; dicts keep insertion order)
+                    due_dates = list(dict.fromkeys(author_dates + feedback_dates))
                 
                 # General date patterns for other assessments
                 if not due_dates:
-                    # Pattern for dates: "October 1", "Oct 1", "November 14th", "Sunday, Oct 19", "December exam period"
-                    # Handle ordinal suffixes (st, nd, rd, th) by making them optional
-                    date_patterns = [
-                        r'(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday),?\s+(Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)\.?\s+(\d{1,2})(?:st|nd|rd|th)?',
-                        r'(Oct|Nov|Dec|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|September|October|November|December|January|February|March|April|May|June|July|August)\.?\s+(\d{1,2})(?:st|nd|rd|th)?',
-                    ]
-                
-                    for date_pattern in date_patterns:
-                        date_matches = re.finditer(date_pattern, row_text, re.IGNORECASE)
-                        for date_match in date_matches:
-                            if len(date_match.groups()) == 2:
-                                month = date_match.group(1)
-                                day = date_match.group(2)
-                                
-                                # Determine year
-                                year = 2025
-                                if '2026' in row_text or any(m in row_text.lower() for m in ['january', 'february', 'march', 'april', 'jan', 'feb', 'mar', 'apr']):
-                                    year = 2026
-                                
-                                date_str = f"{month} {day}, {year}"
-                                # Avoid duplicates
-                                if date_str not in due_dates:
-                                    due_dates.append(date_str)
+                    # Dates like "October 1", "Oct 1", "November 14th", "Sunday, Oct 19"
+                    # ("December exam period" is handled below)
+                    # Determine year - the same for every date in this row
+                    year = 2025
+                    if '2026' in row_text or any(m in row_text_low for m in ['jan', 'feb', 'mar', 'apr']):
+                        year = 2026
+                    
+                    for month, day in _scan_month_day_dates(row_text):
+                        date_str = f"{month} {day}, {year}"
+                        # Avoid duplicates - due_date_values holds exactly the dates in due_dates here
+                        if date_str not in due_date_values:
+                            due_dates.append(date_str)
+                            due_date_values[date_str] = _date_from_parts(month, day, year)
+                            # Only the first 2 dates are used below (PeerWise rows use the last one, so keep them all)
+                            if len(due_dates) >= 2 and not is_peerwise:
+                                break
                 
                 # Handle "December exam period" or date ranges
-                if not due_dates and ('exam period' in row_text.lower() or ('december' in row_text.lower() and 'exam' in row_text.lower())):
+                if not due_dates and ('exam period' in row_text_low or ('december' in row_text_low and 'exam' in row_text_low)):
                     # For final exam, use a placeholder date that will be resolved later
                     due_dates.append("December 15, 2025")  # Default, will be refined
+                    due_date_values["December 15, 2025"] = date(2025, 12, 15)
                 
-                # Extract time if present
+                # Extract time if present, as (hour, minute)
                 # For PeerWise, times are usually "11:59 PM" and appear after each date
-                time_str = None
-                if 'peerwise' in assessment_name.lower():
-                    # Look for "by 11:59 PM" pattern (common for PeerWise)
-                    time_match = re.search(r'by\s+(\d{1,2})(?:[:–-](\d{2}))?\s*(AM|PM)', row_text, re.IGNORECASE)
-                    if time_match:
-                        time_str = time_match.group(0)
+                due_time = None
+                feedback_time = None
+                if is_peerwise:
+                    # One pass finds the first "by 11:59 PM" and the one following "feedback:"
+                    for time_match in _PEERWISE_TIME_RE.finditer(row_text_low):
+                        if due_time is None:
+                            due_time = (_to_24_hour(int(time_match.group('hour')), time_match.group('ampm')),
+                                        int(time_match.group('minute') or 0))
+                        if time_match.group('feedback'):
+                            feedback_time = (_to_24_hour(int(time_match.group('hour')), time_match.group('ampm')),
+                                             int(time_match.group('minute') or 59))
+                            break
                 else:
                     # Look for time patterns: "6-8 PM", "11:59 PM", "in class"
-                    time_match = re.search(r'(\d{1,2})(?:[:–-](\d{2}))?\s*(?:[-–]\s*(\d{1,2})(?:[:–-](\d{2}))?)?\s*(AM|PM)', row_text, re.IGNORECASE)
+                    # For a range, the end time is the due time
+                    time_match = _TIME_RANGE_RE.search(row_text_low)
                     if time_match:
-                        time_str = time_match.group(0)
-                    elif 'in class' in row_text.lower():
-                        time_str = 'in class'
+                        if time_match.group('end_hour'):
+                            hour, minute = time_match.group('end_hour'), time_match.group('end_minute')
+                        else:
+                            hour, minute = time_match.group('hour'), time_match.group('minute')
+                        due_time = (_to_24_hour(int(hour), time_match.group('ampm')), int(minute or 0))
+                    elif 'in class' in row_text_low:
+                        due_time = (10, 0)
                 
                 # Create assessment(s) - handle multiple due dates (e.g., PeerWise)
                 if due_dates:
                     # For PeerWise assignments, use the later date (Answer date) as the primary due date
                     # This represents when the assignment is fully complete
-                    if 'peerwise' in assessment_name.lower() and len(due_dates) > 1:
+                    if is_peerwise and len(due_dates) > 1:
                         # Use the last date (Answer/Feedback date) as the primary due date
                         due_date_str = due_dates[-1]
-                        parsed_date = dateparser.parse(due_date_str)
-                        if parsed_date:
-                            # Extract time for the Answer/Feedback date
-                            hour = 23
-                            minute = 59
-                            feedback_time_match = re.search(r'feedback:?[^.]*?by\s+(\d{1,2})(?:[:–-](\d{2}))?\s*(AM|PM)', row_text, re.IGNORECASE)
-                            if feedback_time_match:
-                                hour = int(feedback_time_match.group(1))
-                                minute = int(feedback_time_match.group(2)) if feedback_time_match.group(2) else 59
-                                if feedback_time_match.group(3).upper() == 'PM' and hour != 12:
-                                    hour += 12
-                                elif feedback_time_match.group(3).upper() == 'AM' and hour == 12:
-                                    hour = 0
+                        due_date = due_date_values.get(due_date_str)
+                        if due_date:
+                            # Use the time for the Answer/Feedback date
+                            hour, minute = feedback_time or (23, 59)
                             
-                            due_datetime = datetime.combine(parsed_date.date(), time(hour, minute))
+                            due_datetime = datetime.combine(due_date, time(hour, minute))
                             
                             # Create single assessment with the Answer date
                             assessment = AssessmentTask(
@@ -1542,26 +2300,12 @@ class PDFExtractor:
                     else:
                         # For non-PeerWise or single-date assessments, process normally
                         for date_idx, due_date_str in enumerate(due_dates[:2]):  # Limit to 2 dates per assessment
-                            parsed_date = dateparser.parse(due_date_str)
-                            if parsed_date:
+                            due_date = due_date_values.get(due_date_str)
+                            if due_date:
                                 # Handle time
-                                hour = 23
-                                minute = 59
-                                if time_str:
-                                    if 'in class' in time_str.lower():
-                                        hour = 10
-                                        minute = 0
-                                    else:
-                                        time_match = re.search(r'(\d{1,2})(?:[:–-](\d{2}))?\s*(AM|PM)', time_str, re.IGNORECASE)
-                                        if time_match:
-                                            hour = int(time_match.group(1))
-                                            minute = int(time_match.group(2)) if time_match.group(2) else 0
-                                            if time_match.group(3).upper() == 'PM' and hour != 12:
-                                                hour += 12
-                                            elif time_match.group(3).upper() == 'AM' and hour == 12:
-                                                hour = 0
+                                hour, minute = due_time or (23, 59)
                                 
-                                due_datetime = datetime.combine(parsed_date.date(), time(hour, minute))
+                                due_datetime = datetime.combine(due_date, time(hour, minute))
                                 
                                 assessment = AssessmentTask(
                                     title=self._clean_assessment_title(assessment_name),
@@ -1595,28 +2339,28 @@ class PDFExtractor:
     
     def _classify_assessment_type(self, text: str) -> str:
         """Classify assessment type from text."""
-        text_lower = text.lower()
-        if "assignment" in text_lower or "hw" in text_lower or "homework" in text_lower:
-            return "assignment"
-        elif "lab report" in text_lower or "laboratory report" in text_lower:
-            return "lab_report"
-        elif "quiz" in text_lower:
-            return "quiz"
-        elif "midterm" in text_lower or "mid-term" in text_lower:
-            return "midterm"
-        elif "final" in text_lower:
-            return "final"
-        elif "project" in text_lower:
-            return "project"
-        else:
-            return "other"
+        return _classify_title(text)
     
     def _extract_weight(self, text: str) -> Optional[float]:
         """Extract weight percentage from text."""
-        weight_pattern = r'(\d+(?:\.\d+)?)\s*%'
-        match = re.search(weight_pattern, text)
-        if match:
-            return float(match.group(1))
+        # Scan back from each '%' for "<digits>[.<digits>]" and optional whitespace.
+        # Same result as re.search(r'(\d+(?:\.\d+)?)\s*%') without the regex engine.
+        pct = text.find('%')
+        while pct != -1:
+            end = pct
+            while end > 0 and text[end - 1].isspace():
+                end -= 1
+            start = end
+            while start > 0 and text[start - 1].isdecimal():
+                start -= 1
+            if start < end:
+                # Include the integer part of a decimal weight ("12.5%")
+                if start >= 2 and text[start - 1] == '.' and text[start - 2].isdecimal():
+                    start -= 1
+                    while start > 0 and text[start - 1].isdecimal():
+                        start -= 1
+                return float(text[start:end])
+            pct = text.find('%', pct + 1)
         return None
     
     def _extract_relative_rules(self, text: str) -> List[Tuple[str, str]]:
@@ -1625,23 +2369,8 @@ class PDFExtractor:
         Returns:
             List of (rule_text, anchor) tuples
         """
-        rules = []
-        
-        # Pattern for relative rules
-        rule_patterns = [
-            (r'due\s+(\d+)\s+hours?\s+after\s+(the\s+)?(lab|tutorial|lecture)', 'hours'),
-            (r'due\s+(\d+)\s+days?\s+after\s+(the\s+)?(lab|tutorial|lecture)', 'days'),
-            (r'due\s+(\d+)\s+weeks?\s+after\s+(the\s+)?(lab|tutorial|lecture)', 'weeks'),
-        ]
-        
-        for pattern, unit in rule_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                anchor = match.group(-1)  # lab, tutorial, or lecture
-                rule_text = match.group(0)
-                rules.append((rule_text, anchor))
-        
-        return rules
+        # One scan for hours, days and weeks; group 3 is the anchor (lab, tutorial, or lecture)
+        return [(match.group(0), match.group(3)) for match in _RELATIVE_RULE_RE.finditer(text)]
     
     def _extract_assessments_from_table_structured(self) -> List[AssessmentTask]:
         """Extract assessments from structured tables using pdfplumber.
@@ -1654,25 +2383,25 @@ class PDFExtractor:
         """
         assessments = []
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            # Find pages that might contain assessment tables
-            # Usually in the middle-to-end of the document (pages 4-12 typically)
-            # But check all pages to be thorough
-            for page_num, page in enumerate(pdf.pages, 1):
-                tables = page.extract_tables()
+        # Every page's tables are needed; extract them in parallel for large PDFs
+        self._read_all_tables()
+        
+        # Find pages that might contain assessment tables
+        # Usually in the middle-to-end of the document (pages 4-12 typically)
+        # But check all pages to be thorough
+        for index in range(self._num_pages):
+            for table in self._page_tables(index):
+                if not table or len(table) < 2:
+                    continue
                 
-                for table in tables:
-                    if not table or len(table) < 2:
-                        continue
-                    
-                    # Check if this is an assessment table
-                    if self._is_assessment_table(table):
-                        # Extract assessments from this table
-                        table_assessments = self._extract_from_table(table)
-                        if table_assessments:
-                            assessments.extend(table_assessments)
-                            # Continue searching in case there are multiple assessment tables
-                            # (some PDFs split assessments across pages)
+                # Check if this is an assessment table
+                if self._is_assessment_table(table):
+                    # Extract assessments from this table
+                    table_assessments = self._extract_from_table(table)
+                    if table_assessments:
+                        assessments.extend(table_assessments)
+                        # Continue searching in case there are multiple assessment tables
+                        # (some PDFs split assessments across pages)
         
         return assessments
     
@@ -1721,7 +2450,7 @@ class PDFExtractor:
                 if any(kw in row_text for kw in assessment_keywords):
                     keyword_count += 1
                 # Check for percentage patterns
-                if re.search(r'\d+\.?\d*%', row_text):
+                if _HAS_PERCENT_RE.search(row_text):
                     percentage_count += 1
             
             # Must have at least one assessment keyword and one percentage
@@ -1748,7 +2477,7 @@ class PDFExtractor:
             if any(kw in row_text for kw in assessment_keywords):
                 keyword_count += 1
             # Check for percentage patterns
-            if re.search(r'\d+\.?\d*%', row_text):
+            if _HAS_PERCENT_RE.search(row_text):
                 percentage_count += 1
         
         # Must have at least one assessment keyword and one percentage in data rows
@@ -1966,20 +2695,7 @@ class PDFExtractor:
         Returns:
             Cleaned title
         """
-        if not title:
-            return title
-        
-        # Remove leading numbers and punctuation like "1. ", "2) ", "1: "
-        cleaned = re.sub(r'^\d+[\.\)\:]\s*', '', title)
-        
-        # Remove trailing colons and extra punctuation
-        cleaned = re.sub(r':+\s*$', '', cleaned)
-        cleaned = re.sub(r'\s*:+\s*:', ':', cleaned)  # Multiple colons to single
-        
-        # Clean up whitespace
-        cleaned = ' '.join(cleaned.split())
-        
-        return cleaned.strip()
+        return _clean_title(title)
     
     def _map_table_columns(self, header_row: List, sample_rows: List[List] = None) -> dict:
         """Map table columns to their purpose.
@@ -2071,7 +2787,7 @@ class PDFExtractor:
             if 'weight' not in column_map:
                 for row in sample_rows:
                     for idx, cell in enumerate(row):
-                        if cell and re.search(r'\d+\.?\d*%', str(cell)):
+                        if cell and _HAS_PERCENT_RE.search(str(cell)):
                             column_map['weight'] = idx
                             break
                     if 'weight' in column_map:
@@ -2114,7 +2830,7 @@ class PDFExtractor:
                 if cell and str(cell).strip():
                     text = str(cell).strip()
                     # Skip if it looks like a weight or date
-                    if re.search(r'^\d+\.?\d*%$', text) or re.match(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', text.lower()):
+                    if _ONLY_PERCENT_RE.search(text) or _MONTH_PREFIX_RE.match(text.lower()):
                         continue
                     return text
             return ''
@@ -2136,7 +2852,7 @@ class PDFExtractor:
                     candidate = str(row[idx]).strip()
                     # Skip if it looks like ONLY a weight, format keyword, or metadata
                     # But allow "Test 1", "Quiz 2", etc. (assessment names with numbers)
-                    if (re.search(r'^\d+\.?\d*%$', candidate) or  # Just a percentage
+                    if (_ONLY_PERCENT_RE.search(candidate) or  # Just a percentage
                         candidate.lower() in ['mixed', 'online', 'in-person', 'none', 'n/a', 'not applicable']):
                         continue
                     name_cell = row[idx]
@@ -2152,7 +2868,7 @@ class PDFExtractor:
             name = str(name_cell)
         
         # Clean up common prefixes like "1. " or "2. "
-        name = re.sub(r'^\d+\.\s*', '', name)
+        name = _NUMBERED_PREFIX_RE.sub('', name)
         
         return name.strip()
     
@@ -2182,7 +2898,7 @@ class PDFExtractor:
                 for idx in check_order:
                     if 0 <= idx < len(row) and row[idx]:
                         cell_text = str(row[idx]).strip()
-                        if re.search(r'\d+\.?\d*%', cell_text):
+                        if _HAS_PERCENT_RE.search(cell_text):
                             weight_text = cell_text
                             break
         
@@ -2191,7 +2907,7 @@ class PDFExtractor:
             for cell in row:
                 if cell:
                     cell_text = str(cell).strip()
-                    if re.search(r'\d+\.?\d*%', cell_text):
+                    if _HAS_PERCENT_RE.search(cell_text):
                         weight_text = cell_text
                         break
         
@@ -2203,7 +2919,7 @@ class PDFExtractor:
             return None  # Mark for review
         
         # Extract percentage
-        match = re.search(r'(\d+\.?\d*)%', weight_text)
+        match = _PERCENT_VALUE_RE.search(weight_text)
         if match:
             return float(match.group(1))
         
@@ -2276,15 +2992,8 @@ class PDFExtractor:
                 # Only match if "total" is the main word, not part of another word/phrase
                 # Examples: "Total", "COURSE TOTAL", "Subtotal" = summary row
                 # Examples: "Labs (Total = 8)", "Total Marks" = NOT summary row
-                summary_patterns = [
-                    r'^(course\s+)?total$',  # "Total" or "Course Total" as standalone
-                    r'^subtotal$',  # "Subtotal" as standalone
-                    r'^sum$',  # "Sum" as standalone
-                    r'^grand\s+total$',  # "Grand Total" as standalone
-                ]
-                for pattern in summary_patterns:
-                    if re.match(pattern, name_text, re.IGNORECASE):
-                        return True
+                if _SUMMARY_ROW_RE.match(name_text):
+                    return True
         
         # Check weight column for sum-like values
         if 'weight' in column_map:
@@ -2292,22 +3001,15 @@ class PDFExtractor:
             if weight_idx < len(row) and row[weight_idx]:
                 weight_text = str(row[weight_idx]).strip()
                 # If weight is a large round number (like 100%, 25.00%), might be a total
-                if re.match(r'^\d{2,3}(\.00)?%$', weight_text):
+                if _ROUND_TOTAL_WEIGHT_RE.match(weight_text):
                     # But only if name suggests it's a total
                     if 'name' in column_map:
                         name_idx = column_map['name']
                         if name_idx < len(row) and row[name_idx]:
                             name_text = str(row[name_idx]).lower().strip()
                             # Use same strict patterns as name column check
-                            summary_patterns = [
-                                r'^(course\s+)?total$',
-                                r'^subtotal$',
-                                r'^sum$',
-                                r'^grand\s+total$',
-                            ]
-                            for pattern in summary_patterns:
-                                if re.match(pattern, name_text, re.IGNORECASE):
-                                    return True
+                            if _SUMMARY_ROW_RE.match(name_text):
+                                return True
         
         return False
     
@@ -2396,12 +3098,12 @@ class PDFExtractor:
         date_text = date_text.replace('S ept', 'Sept').replace('S eptember', 'September')
         
         # Handle "Opens X... Due Y" format - use the Due date
-        opens_due_match = re.search(r'Opens\s+[^D]*Due\s+([^\.]+)', date_text, re.IGNORECASE)
+        opens_due_match = _OPENS_DUE_RE.search(date_text)
         if opens_due_match:
             date_text = opens_due_match.group(1).strip()
         
         # Handle date ranges like "Dec 2nd/3rd" - use the later date
-        date_range_match = re.search(r'(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?\s*[/-]\s*(\d{1,2})(?:st|nd|rd|th)?', date_text, re.IGNORECASE)
+        date_range_match = _DAY_RANGE_RE.search(date_text)
         if date_range_match:
             month_str = date_range_match.group(1)
             day1 = int(date_range_match.group(2))
@@ -2413,11 +3115,16 @@ class PDFExtractor:
                 year = 2025 if month >= 9 else 2026
                 return datetime(year, month, day, 23, 59)
         
+        # A bare "Month D, YYYY" / "YYYY-MM-DD" date needs no dateparser call
+        known_date = _parse_known_date(date_text.strip())
+        if known_date:
+            return datetime.combine(known_date, time(23, 59))
+        
         # Try dateparser first (handles many formats)
         parsed = dateparser.parse(date_text, settings={'PREFER_DATES_FROM': 'future'})
         if parsed:
             # Extract time if present
-            time_match = re.search(r'(\d{1,2})(?:[:–-](\d{2}))?\s*(AM|PM|am|pm)', date_text, re.IGNORECASE)
+            time_match = _CLOCK_TIME_RE.search(date_text)
             if time_match:
                 hour = int(time_match.group(1))
                 minute = int(time_match.group(2)) if time_match.group(2) else 0
@@ -2431,28 +3138,20 @@ class PDFExtractor:
                 return datetime.combine(parsed.date(), time(23, 59))
         
         # Fallback to regex patterns
-        patterns = [
-            r'(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday),?\s+(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?',
-            r'(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?',
-            r'Due\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+(\w+)\s+(\d{1,2})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_text, re.IGNORECASE)
+        for pattern in _MONTH_DAY_FALLBACK_PATTERNS:
+            match = pattern.search(date_text)
             if match:
                 month_str = match.group(1)
                 day = int(match.group(2))
                 
-                # Determine year (default to 2025, adjust based on month)
-                year = 2025
-                if any(m in month_str.lower() for m in ['jan', 'feb', 'mar', 'apr']):
-                    year = 2026
-                
                 # Convert month name to number
                 month = self._month_name_to_num(month_str)
                 if month:
+                    # Determine year (default to 2025, adjust based on month)
+                    year = _MONTH_TO_YEAR.get(month_str.lower().rstrip('.'), 2025)
+                    
                     # Extract time if present
-                    time_match = re.search(r'(\d{1,2})(?:[:–-](\d{2}))?\s*(AM|PM|am|pm)', date_text, re.IGNORECASE)
+                    time_match = _CLOCK_TIME_RE.search(date_text)
                     if time_match:
                         hour = int(time_match.group(1))
                         minute = int(time_match.group(2)) if time_match.group(2) else 0
@@ -2475,21 +3174,6 @@ class PDFExtractor:
         Returns:
             Month number (1-12), or None if invalid
         """
-        month_map = {
-            'jan': 1, 'january': 1,
-            'feb': 2, 'february': 2,
-            'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4,
-            'may': 5,
-            'jun': 6, 'june': 6,
-            'jul': 7, 'july': 7,
-            'aug': 8, 'august': 8,
-            'sep': 9, 'sept': 9, 'september': 9,
-            'oct': 10, 'october': 10,
-            'nov': 11, 'november': 11,
-            'dec': 12, 'december': 12,
-        }
-        
         month_lower = month_str.lower().rstrip('.')
-        return month_map.get(month_lower)
+        return _MONTH_NUMBERS.get(month_lower)
 
@@ -234,9 +234,12 @@ class RuleResolver:
         current_date = start_date
         first_occurrence = None
         
+        # Meeting days as a bitmask, so each date is checked with one bit test
+        days_mask = section.days_mask
+        
         # Find first day of week that matches
         while current_date <= end_date:
-            if current_date.weekday() in section.days_of_week:
+            if days_mask >> current_date.weekday() & 1:
                 first_occurrence = current_date
                 break
             current_date += timedelta(days=1)
@@ -245,9 +248,10 @@ class RuleResolver:
             return []
         
         # Generate all occurrences
+        last_day = max(section.days_of_week)
         current_date = first_occurrence
         while current_date <= end_date:
-            if current_date.weekday() in section.days_of_week:
+            if days_mask >> current_date.weekday() & 1:
                 # Combine date with section time
                 occurrence = datetime.combine(
                     current_date,
@@ -256,7 +260,7 @@ class RuleResolver:
                 occurrences.append(occurrence)
             
             # Move to next week
-            if current_date.weekday() == max(section.days_of_week):
+            if current_date.weekday() == last_day:
                 current_date += timedelta(days=7)
             else:
                 current_date += timedelta(days=1)
@@ -36,6 +36,7 @@ def test_section_option():
     assert section.section_type == "Lecture"
     assert section.section_id == "001"
     assert section.days_of_week == [0, 2, 4]
+    assert section.days_mask == 0b10101
     assert section.location == "UC 202"
 
 
@@ -0,0 +1,395 @@
+"""Unit tests for PDF extraction helpers."""
+
+import re
+import pytest
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+import src.pdf_extractor as pdf_extractor
+from src.cache import compute_pdf_hash
+from src.models import AssessmentTask, CourseTerm
+from src.pdf_extractor import (
+    PDFExtractor, _build_keyword_matcher, _compile_alternation, _find_text_evaluation_section,
+    _normalize_title_key, _scan_month_day_dates
+)
+
+
+@pytest.fixture
+def extractor():
+    """PDFExtractor without a loaded PDF, for testing text helpers."""
+    return PDFExtractor.__new__(PDFExtractor)
+
+
+@pytest.fixture
+def outline_pdf(tmp_path):
+    """Eight-page PDF with a line of text and a ruled 2x2 table on each page."""
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    for number in range(1, 9):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {number}: Assignment {number} due Oct {number + 10}")
+        for y in (100, 130, 160):
+            page.draw_line((72, y), (372, y))
+        for x in (72, 222, 372):
+            page.draw_line((x, 100), (x, 160))
+        page.insert_text((80, 120), f"Quiz {number}")
+        page.insert_text((230, 120), f"{number}%")
+        page.insert_text((80, 150), "Final Exam")
+        page.insert_text((230, 150), "40%")
+    path = tmp_path / "outline.pdf"
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Quiz 1 10% Oct 5", 10.0),
+    ("Midterm Test 22.5 % in class", 22.5),
+    ("Final Exam 40%", 40.0),
+    ("Worth 1.2.3% of grade", 2.3),
+    ("Bonus .5% then 3%", 5.0),
+    ("Participation 5.% then 15 %", 15.0),
+    ("No weight listed", None),
+    ("%", None),
+])
+def test_extract_weight(extractor, text, expected):
+    """Test weight extraction from assessment row text."""
+    assert extractor._extract_weight(text) == expected
+
+
+def test_extract_weight_matches_regex(extractor):
+    """Test weight scanner agrees with the original regex."""
+    samples = [
+        "Assignment 1 15% due Oct 1", "  7 %", "a 1.5.%", "x12.34%y", "50%% 60%",
+        "Lab .25 %", "3.\n%", "weight: 10\t%", "9.9.9 %",
+    ]
+    for text in samples:
+        match = re.search(r'(\d+(?:\.\d+)?)\s*%', text)
+        expected = float(match.group(1)) if match else None
+        assert extractor._extract_weight(text) == expected, text
+
+
+@pytest.mark.parametrize("days_str,expected", [
+    ("MWF", [0, 2, 4]),
+    ("TTh", [1, 3]),
+    ("MTWThF", [0, 1, 2, 3, 4]),
+    ("TR", [1, 3]),
+    ("M", [0]),
+    ("Mon/Wed/Fri", [0, 2, 4]),
+    ("S/Su", [5, 6]),
+    ("M/W/F", [0, 2, 4]),
+    ("Tuesday", [1]),
+    ("Wednesdays", [2]),
+    ("Tues/Thurs", [1, 3]),
+    ("Sat/Sun", [5, 6]),
+    ("", []),
+])
+def test_parse_days_of_week(extractor, days_str, expected):
+    """Test day abbreviation parsing."""
+    assert extractor._parse_days_of_week(days_str) == expected
+
+
+def test_keyword_matcher():
+    """Test keyword prefilter finds any keyword anywhere in the line."""
+    has_keyword = _build_keyword_matcher(('quiz', 'midterm', 'lab report'))
+    assert has_keyword("in class quiz 3")
+    assert has_keyword("final lab report 10%")
+    assert has_keyword("midterm")
+    assert not has_keyword("course policies 10%")
+    assert not has_keyword("")
+
+
+def test_extract_relative_rules(extractor):
+    """Test relative deadline rules are found with their anchor, in text order."""
+    text = "Report due 2 days after the lab. Summary due 24 hours after Tutorial."
+    assert extractor._extract_relative_rules(text) == [
+        ("due 2 days after the lab", "lab"),
+        ("due 24 hours after Tutorial", "Tutorial"),
+    ]
+    assert extractor._extract_relative_rules("due next week") == []
+
+
+@pytest.mark.parametrize("title,expected", [
+    ("In Class Quiz 1 (Online)", "quiz 1"),
+    ("Midterm  Test 2", "midterm 2"),
+    ("Final Exam", "final"),
+    ("Lab Report", "lab report"),
+    ("Participation", "participation"),
+])
+def test_normalize_title_key(title, expected):
+    """Test assessment titles reduce to their deduplication key."""
+    assert _normalize_title_key(title) == expected
+
+
+@pytest.mark.parametrize("text,expected_days", [
+    ("Tuesday 2:30 pm-4:30 pm", [1]),
+    ("Wednesday and Friday 9:00-10:00 am", [2]),
+    ("MWF 9:30-10:20", [0, 2, 4]),
+    ("Lecture M/W/F 9:30-10:20", None),
+    ("no days 1:00-2:00", None),
+])
+def test_parse_time_and_days_first_day_match(extractor, text, expected_days):
+    """Test the first matching day pattern decides the meeting days."""
+    parsed = extractor._parse_time_and_days_from_text(text)
+    assert (parsed[0] if parsed else None) == expected_days
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Intro\nMethods of\nEvaluation\nQuiz 10%", 6),
+    ("Course Evaluation: see below", 7),
+    ("Course Evaluations\nGrading Scheme", 19),
+    ("Peer evaluations only", -1),
+    ("", -1),
+])
+def test_find_text_evaluation_section(text, expected):
+    """Test the grade breakdown heading is found where the section patterns would find it."""
+    assert _find_text_evaluation_section(text) == expected
+
+
+@pytest.mark.parametrize("section_type,text,expected", [
+    ("lab", "Tutorial 003 TTh 1:00-2:00", [("003", [1, 3])]),
+    ("lab", "Lab W 2:30-5:30", [("", [2])]),
+    ("lecture", "Section 002: MWF 9:30-10:20", [("002", [0, 2, 4])]),
+    ("lecture", "Lecture M/W/F 9:30-10:20", [("", [0, 2, 4])]),
+    ("lecture", "Lecture 001 M/W/F 9:30-10:20", [("001", [0, 2, 4])]),
+    ("lecture", "Office hours with 10:30-11:20 ... Posts 2:00-3:00", []),
+    ("lecture", "Lectures 10:30-11:20", []),
+    ("lab", "Labs 2:30-5:30", []),
+])
+def test_extract_sections_legacy(extractor, section_type, text, expected):
+    """Test legacy schedule rows are found, and plain prose yields no sections."""
+    sections = extractor._extract_sections_legacy(section_type, text)
+    assert [(s.section_id, s.days_of_week) for s in sections] == expected
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Lecture M/W/F 9:30-10:20", [("", [0, 2, 4])]),
+    ("Lecture 001 M/W/F 9:30-10:20", [("001", [0, 2, 4])]),
+    ("Lecture MWF 9:30-10:20", [("", [0, 2, 4])]),
+])
+def test_extract_sections_slash_days(extractor, monkeypatch, text, expected):
+    """Test slash-separated days aren't cut to their first letter by the text scan."""
+    extractor._sections = None
+    extractor._joined_text_cache = {pdf_extractor.MAX_PAGES_TO_SEARCH: text}
+    monkeypatch.setattr(PDFExtractor, '_extract_schedule_from_tables',
+                        lambda self: {'lecture': [], 'lab': []})
+    lectures, _ = extractor._extract_sections()
+    assert [(s.section_id, s.days_of_week) for s in lectures] == expected
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Due:Oct 19", [("Oct", "19")]),
+    ("Sunday,Oct 19", [("Oct", "19")]),
+    ("Oct 19-Oct 21", [("Oct", "19"), ("Oct", "21")]),
+    ("Oct 2025", []),
+    ("Nov 2nd; Sunday, Oct. 19th", [("Oct", "19"), ("Nov", "2")]),
+])
+def test_scan_month_day_dates(text, expected):
+    """Test month/day dates are found through glued punctuation, weekday dates first."""
+    assert _scan_month_day_dates(text) == expected
+
+
+def test_legacy_extractors_read_only_searched_pages(outline_pdf, monkeypatch):
+    """Test skipping legacy assessments leaves pages past the schedule search unread."""
+    monkeypatch.setattr(pdf_extractor, "MAX_PAGES_TO_SEARCH", 4)
+    extractor = PDFExtractor(outline_pdf, force_refresh=True)
+    extractor._run_legacy_extractors(include_assessments=False)
+    assert sorted(extractor._page_text_cache) == [0, 1, 2, 3]
+    extractor._run_legacy_extractors()
+    assert sorted(extractor._page_text_cache) == list(range(8))
+
+
+def test_parallel_pages_match_sequential(outline_pdf, monkeypatch):
+    """Test the process pool reads the same page text and tables as the sequential path."""
+    sequential = PDFExtractor(outline_pdf, force_refresh=True)
+    sequential._read_all_pages()
+    sequential_tables = [sequential._page_tables(index) for index in range(sequential._num_pages)]
+    sequential.close()
+    
+    monkeypatch.setattr(pdf_extractor.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(pdf_extractor, "PARALLEL_PAGE_THRESHOLD", 2)
+    assert len(pdf_extractor._parallel_page_chunks(list(range(8)))) == 2
+    parallel = PDFExtractor(outline_pdf, force_refresh=True, parallel_pages=True)
+    parallel._read_all_pages()
+    parallel._read_all_tables()
+    # Both pools filled every page, so nothing is left to read on demand
+    assert len(parallel._page_tables_cache) == 8
+    assert parallel._page_text_cache == sequential._page_text_cache
+    assert [parallel._page_tables(index) for index in range(8)] == sequential_tables
+    assert sequential_tables[0] == [[["Quiz 1", "1%"], ["Final Exam", "40%"]]]
+
+
+def test_page_cache_shared_between_extractors(outline_pdf):
+    """Test a second extractor for the same file reuses the cached pages, tables and lock."""
+    first = PDFExtractor(outline_pdf, force_refresh=True)
+    first._page_text(0)
+    first.close()
+    second = PDFExtractor(outline_pdf, pdf_hash=compute_pdf_hash(outline_pdf))
+    assert second._page_text_cache is first._page_text_cache
+    assert second._page_tables_cache is first._page_tables_cache
+    assert second._tables_lock is first._tables_lock
+    # Cache hits don't open the PDF
+    assert second._pdf is None
+    assert second._num_pages == 8
+
+
+def test_page_cache_force_refresh(outline_pdf):
+    """Test force_refresh re-reads the PDF instead of reusing the cached pages."""
+    first = PDFExtractor(outline_pdf)
+    first.close()
+    refreshed = PDFExtractor(outline_pdf, force_refresh=True)
+    assert refreshed._page_text_cache is not first._page_text_cache
+    assert refreshed._tables_lock is not first._tables_lock
+    assert refreshed._pdf is not None
+    refreshed.close()
+    # The refreshed entry replaces the old one for later extractors
+    assert PDFExtractor(outline_pdf)._page_text_cache is refreshed._page_text_cache
+
+
+def test_page_cache_force_refresh_keeps_other_entries(outline_pdf, monkeypatch):
+    """Test force_refresh of a cached PDF replaces its entry without evicting another."""
+    monkeypatch.setattr(pdf_extractor, "_PAGE_CACHE", {})
+    monkeypatch.setattr(pdf_extractor, "PAGE_CACHE_SIZE", 2)
+    PDFExtractor(outline_pdf, pdf_hash="other").close()
+    PDFExtractor(outline_pdf).close()
+    PDFExtractor(outline_pdf, force_refresh=True).close()
+    assert list(pdf_extractor._PAGE_CACHE) == ["other", compute_pdf_hash(outline_pdf)]
+
+
+def test_page_cache_eviction_threaded(outline_pdf, monkeypatch):
+    """Test extractors built in parallel threads evict cache entries without colliding."""
+    monkeypatch.setattr(pdf_extractor, "_PAGE_CACHE", {})
+    monkeypatch.setattr(pdf_extractor, "PAGE_CACHE_SIZE", 1)
+    
+    def build(number):
+        PDFExtractor(outline_pdf, pdf_hash=f"hash-{number}").close()
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(build, range(64)))
+    assert len(pdf_extractor._PAGE_CACHE) == 1
+
+
+@pytest.mark.parametrize("backend", ["re", "re2"])
+@pytest.mark.parametrize("text,expected", [
+    ("Section 002: Monday 9:30-10:20", ("Monday", "9", "30")),
+    ("Section\u00a0002:\u00a0Monday\u00a09:30-10:20", ("Monday", "9", "30")),
+    ("Lab\u2009Wed \u0669:30-10:20", ("Wed", "\u0669", "30")),
+    ("Section 002 TBA", None),
+])
+def test_compile_alternation_backends(backend, text, expected, monkeypatch):
+    """Test RE2 and re match the same Unicode whitespace and digits in str patterns."""
+    if backend == "re2":
+        pytest.importorskip("re2")
+    monkeypatch.setattr(pdf_extractor, "HAS_RE2", backend == "re2")
+    pattern = _compile_alternation(r'(?i)(?:Section|Lab)\s*\d*[:\s]+(\w+)\s+(\d{1,2})[:.](\d{2})')
+    match = pattern.search(text)
+    assert (match.groups() if match else None) == expected
+
+
+def _extractor_with_pages(*pages):
+    """PDFExtractor whose page text is already cached, for testing page scans."""
+    extractor = PDFExtractor.__new__(PDFExtractor)
+    extractor._pdf = None
+    extractor._num_pages = len(pages)
+    extractor._page_text_cache = dict(enumerate(pages))
+    return extractor
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("ECE 2205 Fall 2025 Course Outline", ("Fall 2025", 2025)),
+    ("ECE 2205 Fall\u00a02025 Course Outline", ("Fall 2025", 2025)),
+    ("Winter\u00a0Term\u00a02026", ("Winter 2026", 2026)),
+])
+def test_extract_term_name(text, expected):
+    """Test term names are found through Unicode whitespace such as non-breaking spaces."""
+    extractor = _extractor_with_pages(text)
+    extractor._joined_text_cache = {}
+    term = extractor.extract_term()
+    assert (term.term_name, term.start_date.year) == expected
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("FALL 2026 COURSE OUTLINE", ("FALL 2026", date(2026, 9, 1), date(2026, 12, 15))),
+    ("winter term 2027", ("winter 2027", date(2027, 1, 8), date(2027, 4, 30))),
+])
+def test_extract_term_season_case(text, expected):
+    """Test upper- and lower-case term headers get their season's default dates."""
+    extractor = _extractor_with_pages(text)
+    extractor._joined_text_cache = {}
+    term = extractor.extract_term()
+    assert (term.term_name, term.start_date, term.end_date) == expected
+
+
+@pytest.mark.parametrize("pages,expected", [
+    (("Cover page", "Final Exam will be held on December\n15, 2025 in the gym"),
+     [("Final Exam", "final", "Page 2: Final Exam will be held on December\n15, 2025")]),
+    (("Lab\nReport 2 due on Oct 5, 2025",),
+     [("Lab Report 2 due on Oct 5, 2025", "other", "Page 1: Lab\nReport 2 due on Oct 5, 2025")]),
+    (("Quiz 2 due 10/14/2025 worth 5%",), [("Quiz 2", "quiz", "Page 1: Quiz 2 due 10/14/2025")]),
+    # Two kinds on one line: the quiz match spans the final exam, which is still found
+    (("Quiz 3 due before the Final Exam on Dec 12, 2025",),
+     [("Quiz 3", "quiz", "Page 1: Quiz 3 due before the Final Exam on Dec 12, 2025"),
+      ("Final Exam", "final", "Page 1: Final Exam on Dec 12, 2025")]),
+    (("Office hours by appointment",), []),
+])
+def test_extract_assessments_with_due_dates(pages, expected):
+    """Test legacy due-date matches are found across line wraps and cite their page."""
+    assessments = _extractor_with_pages(*pages)._extract_assessments_with_due_dates()
+    assert [(a.title, a.type, a.source_evidence) for a in assessments] == expected
+
+
+def _tasks(title, count, weight):
+    """count AssessmentTasks titled "<title> N", each worth weight percent."""
+    return [AssessmentTask(title=f"{title} {n}", type="other", weight_percent=weight) for n in range(1, count + 1)]
+
+
+@pytest.mark.parametrize("new_assessments,expected_source", [
+    # 100% over five untyped rows scores exactly 75: confident, legacy assessments are skipped
+    (_tasks("Essay", 5, 20), "new"),
+    # 100% over four rows scores 70: legacy runs, and its 90-point result wins
+    (_tasks("Essay", 4, 25), "legacy"),
+])
+def test_legacy_assessments_confidence_gate(new_assessments, expected_source, monkeypatch):
+    """Test legacy assessments only compete when the new pipeline scores below the gate.
+    
+    At the gate the legacy result is skipped even where it would have scored higher.
+    """
+    legacy_assessments = _tasks("Quiz", 5, 20)
+    calls = []
+    
+    class FakeAssessmentExtractor:
+        def __init__(self, doc_structure, pdf_path=None):
+            pass
+        
+        def extract(self):
+            return new_assessments
+        
+        def get_debug_info(self):
+            return {}
+    
+    class FakeCourseInfoExtractor:
+        def __init__(self, doc_structure):
+            pass
+        
+        def extract(self):
+            return "ECE 2205", "Circuits"
+        
+        def get_debug_info(self):
+            return {}
+    
+    def fake_run_legacy(self, include_assessments=True):
+        calls.append(include_assessments)
+        term = CourseTerm(term_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 12, 15))
+        return term, [], [], legacy_assessments if include_assessments else []
+    
+    monkeypatch.setattr(pdf_extractor, "DocumentStructureExtractor",
+                        lambda path: type("Extractor", (), {"extract": lambda self: None})())
+    monkeypatch.setattr(pdf_extractor, "AssessmentExtractor", FakeAssessmentExtractor)
+    monkeypatch.setattr(pdf_extractor, "CourseInfoExtractor", FakeCourseInfoExtractor)
+    monkeypatch.setattr(PDFExtractor, "_run_legacy_extractors", fake_run_legacy)
+    extractor = PDFExtractor.__new__(PDFExtractor)
+    extractor.pdf_path = None
+    
+    data = extractor._extract_with_document_structure()
+    assert calls == [expected_source == "legacy"]
+    assert extractor._assessment_source == expected_source
+    assert data.assessments == (legacy_assessments if expected_source == "legacy" else new_assessments)